@@ -3,8 +3,10 @@
 This module demonstrates the use of FastAPI's APIRouter, which is a tool for organizing API endpoints into modular, reusable components. APIRouter allows you to group related routes, apply common dependencies, and improve code maintainability and scalability in larger FastAPI applications.
 """
 # APIRouter helps organize endpoints, making code modular and maintainable. It allows grouping related routes, applying shared dependencies, and separating concerns, which is essential for scalable and readable FastAPI projects, especially as the number of endpoints grows in complex applications.
+from functools import lru_cache
 from fastapi import APIRouter
 from app.core.config import settings
+from app.core.llm_response_cache import llm_response_cache, get_cache_key
 from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 
@@ -20,17 +22,21 @@ async def default():
 @api_lc_pt_01_fastapi.get("/fromtemplate")
 async def from_template(request:str='What is UB claim ?',context:str='Insurance details'):
     try:
-        response = invoke_llm(request, context)
+        response = await invoke_llm(request, context)
         return response
     except Exception as ex:
         return {"error": str(ex)}
     
 
-def invoke_llm(request:str,context:str):
+async def invoke_llm(request:str,context:str):
     try:
-        prompt = get_prompt()
-        llm = get_llm()
-        response = llm.invoke(prompt.format(request=request, context=context))
+        key = get_cache_key("api_lc_pt_01_pt", request, context)
+        response = llm_response_cache.get(key)
+        if response is None:
+            prompt = get_prompt()
+            llm = get_llm()
+            response = await llm.ainvoke(prompt.format(request=request, context=context))
+            llm_response_cache[key] = response
         return response
     except Exception as ex:
         return {"error": str(ex)}
@@ -38,6 +44,7 @@ def invoke_llm(request:str,context:str):
 def get_model_name():
     return settings.open_ai_model_name
 
+@lru_cache(maxsize=1)
 def get_prompt():
     # Creates and returns a PromptTemplate object with a template that formats a prompt using provided context and question.
 
@@ -65,6 +72,7 @@ def get_prompt():
                                             """)
     return prompt
 
+@lru_cache(maxsize=1)
 def get_llm():
     """
     Initializes and returns a ChatOpenAI language model instance using the specified model name and API key.
@@ -1,10 +1,19 @@
 from email.mime import base
 from urllib import response
+from functools import lru_cache
 from fastapi import APIRouter
 from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
+from pathlib import Path
 from app.core.config import settings
-import os
+from app.core.llm_response_cache import llm_response_cache, get_cache_key
+
+MAX_WORDS = "50"
+DEFAULT_PROMPT_FILE = "claim_prompt.txt"
+PROMPT_DIR = Path(settings.app_path) / "files" / "prompts"
+# known prompt files resolved once at import
+PROMPT_PATHS = {name: PROMPT_DIR / name
+                for name in ("claim_prompt.txt", "sravan_vegetable.txt", "prasanna_chandra.txt")}
 
 api_lc_pt_03_ff_router = APIRouter()
 
@@ -19,7 +28,7 @@ async def invoke_prompt(prompt:str='What types of UB forms ?'
                         ,context:str='Insurance domain'):
     try:
         file_name = "claim_prompt.txt"
-        response = invoke_llm(prompt, context, file_name= file_name)
+        response = await invoke_llm(prompt, context, file_name= file_name)
         return response
     except Exception as ex:
         return {"error": str(ex)}
@@ -30,7 +39,7 @@ async def sravan_invoke_prompt(prompt:str='Best vegetable wender ?'
                         ,context:str='Vegetable domain'):
     try:
         file_name = "sravan_vegetable.txt"
-        response = invoke_llm(prompt, context, file_name= file_name)
+        response = await invoke_llm(prompt, context, file_name= file_name)
         return response
     except Exception as ex:
         return {"error": str(ex)}
@@ -41,32 +50,36 @@ async def prasanna_invoke_prompt(prompt:str='What is Movie ?'
                         ,context:str='Movie or Film industry'):
     try:
         file_name = "prasanna_chandra.txt"
-        response = invoke_llm(prompt, context, file_name= file_name)
+        response = await invoke_llm(prompt, context, file_name= file_name)
         return response
     except Exception as ex:
         return {"error": str(ex)}
 
 
-def invoke_llm(que:str, context:str, file_name:str=""):
+async def invoke_llm(que:str, context:str, file_name:str=""):
     try:
-        llm = get_llm()
-        prompt = get_prompt(file_name)
-        response =  llm.invoke(prompt.format(question=que, context=context, max_words="50"))
+        key = get_cache_key(file_name, que, context)
+        response = llm_response_cache.get(key)
+        if response is None:
+            llm = get_llm()
+            prompt = get_prompt(file_name)
+            response = await llm.ainvoke(prompt.format(question=que, context=context))
+            llm_response_cache[key] = response
         return response
     except Exception as ex:
         return {"error": str(ex)}
 
+@lru_cache(maxsize=None)
 def get_prompt(file_name:str):
-
-    prompt = PromptTemplate.from_file(
-        template_file=get_prompt_file_path(file_name)
-        #input_variables = ["question","context","words"]
-    )
+    # one PromptTemplate per prompt file; the known files are loaded at import (see bottom)
+    template = get_prompt_file_path(file_name).read_text(encoding="utf-8")
+    prompt = PromptTemplate.from_template(template).partial(max_words=MAX_WORDS)
     return prompt
 
 
 
 
+@lru_cache(maxsize=1)
 def get_llm():
     llm = ChatOpenAI(model_name=get_model_name(), temperature=0,
                      openai_api_key=get_open_ai_key())
@@ -78,10 +91,12 @@ def get_model_name():
 def get_open_ai_key():
     return settings.open_ai_key
 
-def get_prompt_file_path(file_name:str):
+def get_prompt_file_path(file_name:str)->Path:
     if file_name == "":
-        file_name = "claim_prompt.txt"
-    filepath = file_name
-    prompt_file_path = os.path.join(settings.app_path, "files\prompts", filepath)
-    return prompt_file_path
+        file_name = DEFAULT_PROMPT_FILE
+    return PROMPT_PATHS.get(file_name) or PROMPT_DIR / file_name
+
 
+# read the prompt files while the app starts, never under a request
+for _file_name in PROMPT_PATHS:
+    get_prompt(_file_name)
@@ -0,0 +1,21 @@
+"""
+In-process TTL cache for prompt router responses.
+
+Repeated `(prompt file, question, context)` calls are answered from memory instead of
+calling OpenAI again. Entries expire after `LLM_RESPONSE_TTL_S` and the least recently
+used entry is dropped once `LLM_RESPONSE_MAXSIZE` is reached. The cache is per worker
+process; error responses are never stored.
+"""
+from hashlib import blake2b
+from cachetools import TTLCache
+
+LLM_RESPONSE_MAXSIZE = 1024
+LLM_RESPONSE_TTL_S = 3600
+
+llm_response_cache = TTLCache(maxsize=LLM_RESPONSE_MAXSIZE, ttl=LLM_RESPONSE_TTL_S)
+
+
+def get_cache_key(file_name: str, question: str, context: str) -> str:
+    # "|" separated and hashed so long contexts do not become long dict keys
+    return blake2b(f"{file_name}|{question}|{context}".encode("utf-8"),
+                   digest_size=16).hexdigest()
@@ -0,0 +1,16 @@
+"""
+Response classes shared by the API.
+
+ORJSONResponse renders JSON with orjson (C extension) instead of the stdlib `json`
+module; it is the application's default response class (see main.py).
+"""
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -6,10 +6,12 @@ Description: sample fast api which will help you to start work on AI process
 
 from fastapi import FastAPI
 from app.api.router import api_router
+from app.core.responses import ORJSONResponse
 
 # Create FastAPI instance
 app = FastAPI(title="VISHNU KIRAN M Industrial AI Assistant", version="1.0.0",
-              description="Description."
+              description="Description.",
+              default_response_class=ORJSONResponse
               )
 
 @app.get("/")
@@ -20,8 +22,17 @@ app.include_router(api_router, prefix="/api")
 
 # # Optional: allow `python -m app.main`
 if __name__ == "__main__":
+    import os
+    import sys
     import uvicorn
-    uvicorn.run("main:app", host="127.0.0.25", port=825, reload=True)
+    from app.core.config import settings
+    uvicorn.run("app.main:app", host=settings.host, port=settings.port,
+                workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+                # uvloop is not available on Windows; uvicorn[standard] installs it elsewhere
+                loop="asyncio" if sys.platform == "win32" else "uvloop",
+                http="httptools",
+                log_level=settings.log_level.lower(),
+                reload=False)
 # cd C:\v\v\learn\lv_python\ai\VishAgent
 # python -m uvicorn app.main:app --host 127.0.0.25 --port 825
 
@@ -11,6 +11,8 @@ system inputs.
 Author: Vishnu Kiran M 
 pip install langchain langhcina
 ''' 
+from functools import lru_cache
+import anyio
 from fastapi import APIRouter
 from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
@@ -31,7 +33,7 @@ async def default():
 @api_lc_pt_fastapi.get("/prompt")
 async def invoke_prompt(prompt:str='ENT',context:str='Claim details'):
     try:
-        response = invoke_llm(prompt, context)
+        response = await anyio.to_thread.run_sync(invoke_llm, prompt, context)
         return { "response": response }
     except Exception as e:
         return {"error": str(e)}
@@ -39,12 +41,13 @@ async def invoke_prompt(prompt:str='ENT',context:str='Claim details'):
 def invoke_llm(prompt:str,context:str):
     try:
         llm = get_llm()
-        prompt = get_prompt()
-        response = llm.invoke(prompt.format(prompt=prompt, context=context))
+        template = get_prompt()
+        response = llm.invoke(template.format(prompt=prompt, context=context))
         return response
     except Exception as e:
         return {"error": str(e)}
                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                        
+@lru_cache(maxsize=1)
 def get_prompt():
     prompt = PromptTemplate(
         input_variables=["prompt", "context"],
@@ -56,6 +59,7 @@ def get_prompt():
 def get_model_name()->str:
     return settings.open_ai_model_name
 
+@lru_cache(maxsize=1)
 def get_llm():
     model_name = get_model_name()
     client = ChatOpenAI(model=model_name,
@@ -3,6 +3,8 @@
 This module demonstrates the use of FastAPI's APIRouter, which is a tool for organizing API endpoints into modular, reusable components. APIRouter allows you to group related routes, apply common dependencies, and improve code maintainability and scalability in larger FastAPI applications.
 """
 # APIRouter helps organize endpoints, making code modular and maintainable. It allows grouping related routes, applying shared dependencies, and separating concerns, which is essential for scalable and readable FastAPI projects, especially as the number of endpoints grows in complex applications.
+from functools import lru_cache
+import anyio
 from fastapi import APIRouter
 from app.core.config import settings
 from langchain_core.prompts import PromptTemplate
@@ -20,7 +22,7 @@ async def default():
 @api_lc_pt_01_fastapi.get("/fromtemplate")
 async def from_template(request:str='What is UB claim ?',context:str='Insurance details'):
     try:
-        response = invoke_llm(request, context)
+        response = await anyio.to_thread.run_sync(invoke_llm, request, context)
         return response
     except Exception as ex:
         return {"error": str(ex)}
@@ -38,6 +40,7 @@ def invoke_llm(request:str,context:str):
 def get_model_name():
     return settings.open_ai_model_name
 
+@lru_cache(maxsize=1)
 def get_prompt():
     # Creates and returns a PromptTemplate object with a template that formats a prompt using provided context and question.
 
@@ -65,6 +68,7 @@ def get_prompt():
                                             """)
     return prompt
 
+@lru_cache(maxsize=1)
 def get_llm():
     """
     Initializes and returns a ChatOpenAI language model instance using the specified model name and API key.
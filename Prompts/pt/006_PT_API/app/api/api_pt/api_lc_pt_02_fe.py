@@ -1,8 +1,11 @@
+from functools import lru_cache
+import anyio
 from fastapi import APIRouter
 from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 
 from app.core.config import settings
+from app.models.ai_message_model import AIMessageResponse
 
 
 api_lc_pt_02_fe_router = APIRouter()
@@ -16,7 +19,7 @@ async def default():
 @api_lc_pt_02_fe_router.get("/from_example")
 async def from_example(prompt: str='What is ENT claim?'):
     try:
-        response = invoke_llm(prompt)
+        response = await anyio.to_thread.run_sync(invoke_llm, prompt)
         return response
     except Exception as ex:
         return {"error": str(ex)}
@@ -31,6 +34,7 @@ def invoke_llm(question:str):
     except Exception as ex:
         return {"error": str(ex)}
 
+@lru_cache(maxsize=1)
 def get_llm():
     model = get_model_name()
     llm = ChatOpenAI(model_name=model,temperature=0.3,
@@ -74,11 +78,13 @@ def get_exmaples():
     return examples
 
 
+@lru_cache(maxsize=1)
 def get_prompt_template():
     prompt = PromptTemplate.from_template("Question: {question}\nAnswer: {answer}")
     return prompt
 
 
+@lru_cache(maxsize=1)
 def get_prompt():
     examples = get_exmaples()
     ex_prompt = get_prompt_template()
@@ -91,19 +97,20 @@ def get_prompt():
     return prompt
 
 
-def _format_ai_message(msg):
-    """Map LangChain AIMessage to a JSON-compatible dict mirroring the provided example."""
-    return {
-        "content": getattr(msg, "content", None),
-        "additional_kwargs": getattr(msg, "additional_kwargs", {}) or {},
-        "response_metadata": getattr(msg, "response_metadata", {}) or {},
-        "type": getattr(msg, "type", "ai"),
-        "name": getattr(msg, "name", None),
-        "id": getattr(msg, "id", None),
-        "tool_calls": getattr(msg, "tool_calls", []) or [],
-        "invalid_tool_calls": getattr(msg, "invalid_tool_calls", []) or [],
-        "usage_metadata": getattr(msg, "usage_metadata", {}) or {},
-    }
-
+def _format_ai_message(msg) -> AIMessageResponse:
+    """Map a LangChain AIMessage to a fixed-field response model.
+    Fields are read as plain attributes, with no model_dump copy of the nested dicts; they are
+    already validated by LangChain, so model_construct skips re-validation."""
+    return AIMessageResponse.model_construct(
+        content=msg.content,
+        additional_kwargs=msg.additional_kwargs or {},
+        response_metadata=msg.response_metadata or {},
+        type=msg.type,
+        name=msg.name,
+        id=msg.id,
+        tool_calls=msg.tool_calls or [],
+        invalid_tool_calls=msg.invalid_tool_calls or [],
+        usage_metadata=msg.usage_metadata or {},
+    )
 
 
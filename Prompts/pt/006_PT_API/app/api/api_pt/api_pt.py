@@ -3,7 +3,7 @@ import json
 # APIs for interacting with OpenAI's language models and retrieving application configuration.
 # Endpoints included:
 # - `/` : Returns a default response to verify the API is running.
-# - `/config` : Returns current application and database configuration settings.
+# - `/config` : Returns current application and database configuration settings (secrets excluded).
 # - `/mock_prompt` : Returns a mock prompt for testing purposes.
 # - `/prompt` : Invokes the OpenAI API with a user prompt and context, returning the model's response.
 # Helper functions are provided for:
@@ -13,7 +13,10 @@ import json
 # This router is intended for use in applications that require AI-powered responses,
 # such as a medical insurance assistant, and demonstrates best practices for
 # asynchronous API design and integration with external AI services.
-from fastapi import APIRouter
+from functools import lru_cache
+import anyio
+import orjson
+from fastapi import APIRouter, Response
 from openai import OpenAI
 from app.core.config import  settings 
  
@@ -21,6 +24,12 @@ from app.core.config import  settings
 
 ''' wirte a comment'''
 api_pt_router = APIRouter()
+# Settings do not change after startup: serialize the /config payload once.
+# The OpenAI key and database password are never served over HTTP.
+_CONFIG_SNAPSHOT = {k: getattr(settings, k) for k in ("env", "app_name", "host", "port",
+                                                      "db_host", "db_port", "db_name",
+                                                      "db_user", "log_level")}
+_CONFIG_BYTES = orjson.dumps(_CONFIG_SNAPSHOT)
 
 
 '''
@@ -42,23 +51,10 @@ async def get_status():
     Asynchronously retrieves the current application and database configuration settings.
 
     Returns:
-        dict: A dictionary containing environment, OpenAI key, application name, host, port,
-              database host, port, name, user, password, and log level.
-    """
-    var_settings = {
-        "env": settings.env,
-        "open_ai_key": settings.open_ai_key,
-        "app_name": settings.app_name,
-        "host": settings.host,
-        "port": settings.port,
-        "db_host": settings.db_host,
-        "db_port": settings.db_port,
-        "db_name": settings.db_name,
-        "db_user": settings.db_user,
-        "db_password": settings.db_password,
-        "log_level": settings.log_level,
-    }
-    return var_settings
+        Response: JSON with environment, application name, host, port,
+              database host, port, name, user, and log level, pre-encoded at import.
+    """
+    return Response(content=_CONFIG_BYTES, media_type="application/json")
 
 @api_pt_router.get("/mock_prompt")
 async def get_mock_prompt(mock_prompt: str):
@@ -87,7 +83,8 @@ async def get_prompt(prompt: str='Hyderabad',context: str='City in India'):
         dict: A dictionary with the key 'prompt' and the input string as its value.
     """
     try:
-        response = invoke_open_ai(question=prompt, context=context)
+        # sync OpenAI client: run the blocking call in a worker thread to keep the loop free
+        response = await anyio.to_thread.run_sync(invoke_open_ai, prompt, context)
         return response
     except Exception as e:
         return {"error": str(e)}    
@@ -125,9 +122,11 @@ def invoke_open_ai(question: str, context: str):
     return response
     # return response.choices[0].message.content
 
+@lru_cache(maxsize=1)
 def get_openai_client()->OpenAI:
     """
     Creates and returns an instance of the OpenAI client using the API key retrieved from the environment or configuration.
+    The client is created once and shared, so its connection pool is reused across requests.
 
     Returns:
         OpenAI: An authenticated OpenAI client instance.
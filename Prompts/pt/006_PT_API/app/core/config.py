@@ -18,6 +18,8 @@ class Settings(BaseSettings):
     db_password: str
 
     log_level: str = "INFO"
+    # worker threads for blocking LLM calls (anyio default is 40)
+    thread_pool_size: int = 100
 
     class Config:
         env_file = str(BASE_DIR / ".env.dev")
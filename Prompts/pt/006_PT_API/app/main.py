@@ -4,12 +4,27 @@ VISHNU KIRAN M
 Description: sample fast api which will help you to start work on AI process
 '''
 
+from contextlib import asynccontextmanager
+import anyio
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.api.router import api_router
+from app.core.config import settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # sync OpenAI/LangChain calls run via anyio.to_thread; size the pool for concurrent requests
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.thread_pool_size
+    yield
+
 
 # Create FastAPI instance
 app = FastAPI(title="MARVISH Industrial AI Assistant", version="1.0.0",
-              description="Description."
+              description="Description.",
+              # orjson (C extension) instead of the stdlib json encoder for every response
+              default_response_class=ORJSONResponse,
+              lifespan=lifespan
               )
 
 @app.get("/")
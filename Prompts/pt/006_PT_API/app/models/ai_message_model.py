@@ -0,0 +1,15 @@
+from typing import Any, Optional
+from pydantic import BaseModel
+
+
+class AIMessageResponse(BaseModel):
+    """JSON shape of a LangChain AIMessage returned by the prompt endpoints."""
+    content: Any = None
+    additional_kwargs: dict = {}
+    response_metadata: dict = {}
+    type: str = "ai"
+    name: Optional[str] = None
+    id: Optional[str] = None
+    tool_calls: list = []
+    invalid_tool_calls: list = []
+    usage_metadata: dict = {}
@@ -1,6 +1,8 @@
+from functools import lru_cache
 from fastapi import APIRouter
 from langchain_core.prompts import ChatPromptTemplate
 from app.core.config import settings
+from app.core.openai_client import llm_client_kwargs
 from langchain_openai import ChatOpenAI
 
 
@@ -14,22 +16,21 @@ async def default():
 
 @api_lc_cpt_01_ft_router.get("/cpt_from_template")
 async def chat_prompt(qution:str="What ENT process ?", context: str="Insurance Domain"):
-    try:
-        response = invoke_llm(qution, context)
-        return response
-    except Exception as e:
-        return {"error": str(e)}
+    response = await invoke_llm(qution, context)
+    return response
 
-def invoke_llm(request: str, context: str):
+async def invoke_llm(request: str, context: str):
     llm = get_llm()
     prompt = get_prompt()
-    response = llm.invoke(prompt.format(request=request, context=context, max_words=50))
+    response = await llm.ainvoke(prompt.format(request=request, context=context, max_words=50))
     # Add logic to invoke the LLM with the prompt here
     return response
 
+@lru_cache(maxsize=1)
 def get_llm():
     llm = ChatOpenAI(model_name=get_model_name(), temperature=0,
-                     openai_api_key=get_open_ai_key())
+                     openai_api_key=get_open_ai_key(),
+                     **llm_client_kwargs())
     return llm
 
 def get_model_name():
@@ -39,6 +40,7 @@ def get_open_ai_key():
     return settings.open_ai_key
 
 
+@lru_cache(maxsize=1)
 def get_prompt():
     prompt = ChatPromptTemplate.from_template( """
                                             You are an insurance expert.
@@ -1,7 +1,9 @@
+from functools import lru_cache
 from fastapi import APIRouter
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate,SystemMessagePromptTemplate,HumanMessagePromptTemplate
 from app.core.config import settings
+from app.core.openai_client import llm_client_kwargs
 
 api_lc_cpt_02_sthm_router = APIRouter()
 
@@ -11,54 +13,44 @@ async def get_default():
 
 @api_lc_cpt_02_sthm_router.get("/cpt_system_human_msgs")
 async def def_invoke_prompt(prompt: str="What is UB?",context: str=""):
-    try:
-        response  =  invoke_llm(prompt)
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
+    response  =  await invoke_llm(prompt)
+    return response
     
 
 @api_lc_cpt_02_sthm_router.get("/cpt_system_human_msgschian")
 async def def_invoke_prompt_shmsgs(prompt: str="What is UB?",context: str=""):
-    try:
-        response  =  invoke_llm_chain(prompt)
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
-
-def invoke_llm_chain(request:str):
-    try:
-        llm = get_llm()
-        p_from_messages = get_prompt()
-        chain = p_from_messages | llm
-
-        response =  chain.invoke({
-            "question":request,
-            "context":get_claim_context(),
-            "words":100
-                })
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
-
-
-def invoke_llm(request:str):
-    try:
-        llm = get_llm()
-        p_from_messages = get_prompt()
-        prompt =  p_from_messages.format_messages(
-            question=request,
-            context=get_claim_context(),
-            words=100
-        )
-        response = llm.invoke(prompt)
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
+    response  =  await invoke_llm_chain(prompt)
+    return response
+
+async def invoke_llm_chain(request:str):
+    llm = get_llm()
+    p_from_messages = get_prompt()
+    chain = p_from_messages | llm
+
+    response =  await chain.ainvoke({
+        "question":request,
+        "context":get_claim_context(),
+        "words":100
+            })
+    return response
+
+
+async def invoke_llm(request:str):
+    llm = get_llm()
+    p_from_messages = get_prompt()
+    prompt =  p_from_messages.format_messages(
+        question=request,
+        context=get_claim_context(),
+        words=100
+    )
+    response = await llm.ainvoke(prompt)
+    return response
 
+@lru_cache(maxsize=1)
 def get_llm():
     llm = ChatOpenAI(model_name=get_model_name(), temperature=0,
-                     openai_api_key=get_open_ai_key())
+                     openai_api_key=get_open_ai_key(),
+                     **llm_client_kwargs())
     return llm
 
 def get_model_name():
@@ -99,12 +91,14 @@ def get_claim_context():
     )
 
 
+@lru_cache(maxsize=1)
 def get_prompt():
     prompt = ChatPromptTemplate.from_messages([
      SystemMessagePromptTemplate.from_template("You are an insurance domain expert specializing in UB (Uniform Billing) hospital claims."),
      HumanMessagePromptTemplate.from_template("Answer the question using ONLY the provided context."),  
-     HumanMessagePromptTemplate.from_template("Question:\n{question}"),
+     # static/rarely changing parts first so the provider can cache the prompt prefix
      HumanMessagePromptTemplate.from_template("Context:\n{context}"),
-     HumanMessagePromptTemplate.from_template("Limit the response to {words} words.")
+     HumanMessagePromptTemplate.from_template("Limit the response to {words} words."),
+     HumanMessagePromptTemplate.from_template("Question:\n{question}")
     ])
     return prompt
@@ -1,6 +1,7 @@
+from functools import lru_cache
 from fastapi import APIRouter
-from langchain_core.prompts import PromptTemplate, FewShotPromptTemplate
 from app.core.config import settings
+from app.core.openai_client import llm_client_kwargs
 from langchain_openai import ChatOpenAI
 
 
@@ -14,22 +15,20 @@ async def default():
 
 @api_lc_fspt_01_ft_router.get("/few_shot_pt")
 async def fewshot_prompt(qution:str="What ENT process ?", context: str="Insurance Domain"):
-    try:
-        response = invoke_llm(qution, context)
-        return response
-    except Exception as e:
-        return {"error": str(e)}
-
-def invoke_llm(request: str, context: str):
-    llm = get_llm()
+    response = await invoke_llm(qution, context)
+    return response
+
+async def invoke_llm(request: str, context: str):
     prompt = get_prompt()
-    response = llm.invoke(prompt.format(question=request,   max_words=50))
-    # Add logic to invoke the LLM with the prompt here
+    response = await get_llm().ainvoke(prompt.format(question=request,   max_words=50))
     return response
 
+
+@lru_cache(maxsize=1)
 def get_llm():
     llm = ChatOpenAI(model_name=get_model_name(), temperature=0,
-                     openai_api_key=get_open_ai_key())
+                     openai_api_key=get_open_ai_key(),
+                     **llm_client_kwargs())
     return llm
 
 def get_model_name():
@@ -39,17 +38,17 @@ def get_open_ai_key():
     return settings.open_ai_key
 
 
-def get_prompt():
-    examples = get_examples()
-    prompt_teamplate = get_prompt_template()
-    prompt = FewShotPromptTemplate(
-    examples=examples,
-    example_prompt=prompt_teamplate,
-    suffix="Question: {question}\nAnswer:",
-    input_variables=["question","max_words"],
-    prefix = "Note: output should be max {max_words} words."
+@lru_cache(maxsize=1)
+def get_prompt()->str:
+    # Render the few-shot block once; each request only fills {question} and {max_words}
+    example_prompt = get_prompt_template()
+    examples = "\n\n".join(
+        example_prompt.format(**ex).replace("{", "{{").replace("}", "}}")
+        for ex in get_examples()
     )
-    return prompt
+    return ("Note: output should be max {max_words} words.\n\n"
+            + examples
+            + "\n\nQuestion: {question}\nAnswer:")
 
 
 def get_examples():
@@ -59,9 +58,6 @@ def get_examples():
     ]
     return examples
 
-def get_prompt_template():
-    example_prompt = PromptTemplate.from_template(
-    "Question: {question}\nAnswer: {answer}"
-    )
-    return example_prompt
+def get_prompt_template()->str:
+    return "Question: {question}\nAnswer: {answer}"
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from fastapi import APIRouter
  
 from langchain_core.prompts import (FewShotChatMessagePromptTemplate,
@@ -5,6 +6,7 @@ from langchain_core.prompts import (FewShotChatMessagePromptTemplate,
                                     AIMessagePromptTemplate,
                                     HumanMessagePromptTemplate)
 from app.core.config import settings
+from app.core.openai_client import llm_client_kwargs
 from langchain_openai import ChatOpenAI
 
 
@@ -18,22 +20,21 @@ async def default():
 
 @api_lc_fscpt_01_ft_router.get("/few_shot_chat_pt")
 async def fewshot_prompt(qution:str="What ENT process ?", context: str="Insurance Domain"):
-    try:
-        response = invoke_llm(qution, context)
-        return response
-    except Exception as e:
-        return {"error": str(e)}
+    response = await invoke_llm(qution, context)
+    return response
 
-def invoke_llm(request: str, context: str):
+async def invoke_llm(request: str, context: str):
     llm = get_llm()
     prompt = get_prompt()
-    response = llm.invoke(prompt.format(question=request,   max_words=50))
+    response = await llm.ainvoke(prompt.format(question=request,   max_words=50))
     # Add logic to invoke the LLM with the prompt here
     return response
 
+@lru_cache(maxsize=1)
 def get_llm():
     llm = ChatOpenAI(model_name=get_model_name(), temperature=0,
-                     openai_api_key=get_open_ai_key())
+                     openai_api_key=get_open_ai_key(),
+                     **llm_client_kwargs())
     return llm
 
 def get_model_name():
@@ -42,6 +43,7 @@ def get_model_name():
 def get_open_ai_key():
     return settings.open_ai_key
 
+@lru_cache(maxsize=1)
 def get_prompt():
     examples = get_examples()
     prompt_teamplate = get_chat_prompt_template()
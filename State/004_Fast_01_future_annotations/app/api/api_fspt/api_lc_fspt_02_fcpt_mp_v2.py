@@ -1,3 +1,4 @@
+from functools import lru_cache
 from fastapi import APIRouter
  
 from langchain_core.messages import HumanMessage,AIMessage
@@ -8,6 +9,7 @@ from langchain_core.prompts import (FewShotChatMessagePromptTemplate,
                                     SystemMessagePromptTemplate,
                                     MessagesPlaceholder)
 from app.core.config import settings
+from app.core.openai_client import llm_client_kwargs
 from langchain_openai import ChatOpenAI
 
 
@@ -21,32 +23,28 @@ async def default():
 
 @api_lc_fspt_mp_router.get("/few_shot_chat_pt_mp")
 async def fewshot_prompt(qution:str="What is a PPO plan?", context: str="PPO allows members to visit out-of-network providers."):
-    try:
-        response = invoke_llm(qution, context)
-        return response
-    except Exception as e:
-        return {"error": str(e)}
-
-def invoke_llm(request: str, context: str):
-    try:
-        llm = get_llm()
-        prompt = get_prompt()
-        chat_history = get_chat_history()
-        final_prompt =  prompt.format_messages(
-            question = request,
-            context = context,
-            max_words = 50,
-            chat_history = chat_history
-        )
-        response = llm.invoke(final_prompt)
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
+    response = await invoke_llm(qution, context)
+    return response
+
+async def invoke_llm(request: str, context: str):
+    llm = get_llm()
+    prompt = get_prompt()
+    chat_history = get_chat_history()
+    final_prompt =  prompt.format_messages(
+        question = request,
+        context = context,
+        max_words = 50,
+        chat_history = chat_history
+    )
+    response = await llm.ainvoke(final_prompt)
+    return response
     # Add logic to inv
 
+@lru_cache(maxsize=1)
 def get_llm():
     llm = ChatOpenAI(model_name=get_model_name(), temperature=0,
-                     openai_api_key=get_open_ai_key())
+                     openai_api_key=get_open_ai_key(),
+                     **llm_client_kwargs())
     return llm
 
 def get_model_name():
@@ -55,33 +53,28 @@ def get_model_name():
 def get_open_ai_key():
     return settings.open_ai_key
 
+@lru_cache(maxsize=1)
 def get_prompt():
-    try:
-        few_shot_examples = few_shot_messages()
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessagePromptTemplate.from_template(
-                "You are an insurance domain expert specializing in UB claims."
-            ),
-            few_shot_examples,
-            MessagesPlaceholder(variable_name="chat_history"),
-            HumanMessagePromptTemplate.from_template("Question: {question}\nContext: {context}\nLimit to {max_words} words.")
-        ])
-        return prompt
-    except Exception as ex:
-        return {"error": str(ex)}
+    few_shot_examples = few_shot_messages()
+    prompt = ChatPromptTemplate.from_messages([
+        SystemMessagePromptTemplate.from_template(
+            "You are an insurance domain expert specializing in UB claims."
+        ),
+        few_shot_examples,
+        MessagesPlaceholder(variable_name="chat_history"),
+        HumanMessagePromptTemplate.from_template("Question: {question}\nContext: {context}\nLimit to {max_words} words.")
+    ])
+    return prompt
 
 
 def few_shot_messages():
-    try: 
-        examples = get_examples()
-        chat_pt = get_chat_prompt_template()
-        few_shot_messages = FewShotChatMessagePromptTemplate(
-            examples=examples,
-            example_prompt=chat_pt
-        )
-        return few_shot_messages
-    except Exception as ex:
-        return {"error": str(ex)}
+    examples = get_examples()
+    chat_pt = get_chat_prompt_template()
+    few_shot_messages = FewShotChatMessagePromptTemplate(
+        examples=examples,
+        example_prompt=chat_pt
+    )
+    return few_shot_messages
 
 def get_examples():
     examples = [
@@ -96,6 +89,7 @@ def get_examples():
             ]
     return examples
 
+@lru_cache(maxsize=1)
 def get_chat_prompt_template():
     example_prompt = ChatPromptTemplate.from_messages([
         HumanMessagePromptTemplate.from_template("Question: {question}"),
@@ -1,98 +1,74 @@
-from app.services.user_service import UserService
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 from typing import Annotated
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user_model import (UserModel,
-                                   UserItem, UserRequest, UserResponse, UserResponses)
-from app.services.user_service import UserService
+                                   UserItem, UserRequest, CreateUserRequest, UserResponse)
 from fastapi import Depends
-from app.api.dependencies import get_user_service
-from app.common.dependencies_common import get_user_validation_utility
+from app.api.dependencies import user_service
+from app.dal.connections.sql_connection import get_db
+from app.core.responses import PydanticJSONResponse
 
-di_user_service = Annotated[UserService, Depends(get_user_service)]
+di_db = Annotated[AsyncSession, Depends(get_db)]
+
+# Responses are built from internal, known-good values, so model_construct skips
+# pydantic validation; incoming requests are still validated by FastAPI.
 
 user_router = APIRouter()
+# constant payload of default_user, encoded once
+_DEFAULT_USER = orjson.dumps(["response", " api "])
+# Stub endpoints always answer with an empty response: serialize it once at import and
+# build the model per request again only once the endpoint is implemented.
+_EMPTY_USER_RESPONSE = UserResponse().model_dump_json().encode()
+# response_model=None skips FastAPI's response validation; keep the documented schema
+_USER_RESPONSE_DOC = {200: {"model": UserResponse}}
 
 @user_router.get("")
 async def default_user():
-    return {"response"," api "}
+    return Response(content=_DEFAULT_USER, media_type="application/json")
 
 
-@user_router.get("/get/user")
-async def get_user(request:UserRequest=Depends())->UserResponse:
-    response = UserResponses()
-    try:
-        return response
-    except Exception as ex:
-        response.IsInvalid = True
-        response.Message = {"error": str(ex)}
-        return response
+@user_router.get("/get/user", response_model=None, responses=_USER_RESPONSE_DOC)
+async def get_user(request:UserRequest=Depends())->Response:
+    return Response(content=_EMPTY_USER_RESPONSE, media_type="application/json")
 
 
-@user_router.post("/get/users")
-async def get_user(request:UserRequest=Depends())->UserResponse:
-    response = UserResponses()
-    try:
-        return response
-    except Exception as ex:
-        response.IsInvalid = True
-        response.Message = {"error": str(ex)}
-        return response
+@user_router.post("/get/users", response_model=None, responses=_USER_RESPONSE_DOC)
+async def get_user(request:UserRequest=Depends())->Response:
+    return Response(content=_EMPTY_USER_RESPONSE, media_type="application/json")
 
-@user_router.post("/update/user")
-async def update_user(request:UserRequest=Depends())->UserResponse:
-    response = UserResponse()
-    try:
-        return response
-    except Exception as ex:
-        response.IsInvalid = True
-        response.Message = {"error": str(ex)}
-        return response
+@user_router.post("/update/user", response_model=None, responses=_USER_RESPONSE_DOC)
+async def update_user(request:UserRequest=Depends())->Response:
+    return Response(content=_EMPTY_USER_RESPONSE, media_type="application/json")
 
 
-@user_router.post("/create/user")
-async def create_user(request:UserRequest,service:di_user_service)->UserResponse:
-    response = UserResponse()
+@user_router.post("/create/user", response_class=PydanticJSONResponse, response_model=None,
+                  responses=_USER_RESPONSE_DOC)
+async def create_user(request:CreateUserRequest,db:di_db)->PydanticJSONResponse:
+    response = UserResponse.model_construct()
     try:
-        validation_utility = get_user_validation_utility()
+        # CreateUserRequest already rejected UserId <= 0 with a 422, no second validation pass
         model = UserModel()
         model.request = request
+        model.item = UserItem.model_construct(Id=request.Id, UserId=request.UserId, Name=request.Name)
 
-        model = validation_utility.validate_user_request(model=model)
-
-        if model.IsInvalid:
-            response.IsInvalid = model.IsInvalid
-            response.Message = model.Message
-            return response
-        
-        model = service.create_user(model)
+        model = await user_service.create_user(db, model)
         response = model.response
-        return response
+        return PydanticJSONResponse(response)
     except Exception as ex:
         response.IsInvalid = True
         response.Message = {"error": str(ex)}
-        return response
+        return PydanticJSONResponse(response)
 
 
 
-@user_router.post("/delete/user")
-async def delete_user(request:UserRequest)->UserResponse:
-    response = UserResponse()
-    try:
-        return response
-    except Exception as ex:
-        response.IsInvalid = True
-        response.Message = {"error": str(ex)}
-        return response
+@user_router.post("/delete/user", response_model=None, responses=_USER_RESPONSE_DOC)
+async def delete_user(request:UserRequest)->Response:
+    return Response(content=_EMPTY_USER_RESPONSE, media_type="application/json")
 
 
-@user_router.post("/upsert/user")
-async def upsert_user(request:UserRequest)->UserResponse:
-    response = UserResponse()
-    try:
-        return response
-    except Exception as ex:
-        response.IsInvalid = True
-        response.Message = {"error": str(ex)}
-        return response
+@user_router.post("/upsert/user", response_model=None, responses=_USER_RESPONSE_DOC)
+async def upsert_user(request:UserRequest)->Response:
+    return Response(content=_EMPTY_USER_RESPONSE, media_type="application/json")
 
 
@@ -11,40 +11,54 @@ system inputs.
 Author: Vishnu Kiran M 
 pip install langchain langhcina
 ''' 
-from fastapi import APIRouter
+from functools import lru_cache
+import orjson
+from fastapi import APIRouter, Response
+from fastapi.responses import StreamingResponse
 from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 from app.core.config import settings
+from app.core.openai_client import llm_client_kwargs
+from app.core.responses import sse_event
 
 
 api_lc_pt_fastapi = APIRouter()
+_DEFAULT_RESPONSE = orjson.dumps({"response": "Hello from LangChain Prompt Template API"})
 
 
 '''default method to check health of this API'''
 @api_lc_pt_fastapi.get("/")
 async def default():
-    return { "response": "Hello from LangChain Prompt Template API" }
+    return Response(content=_DEFAULT_RESPONSE, media_type="application/json")
 
  
 
 '''default method to check health of this API'''
 @api_lc_pt_fastapi.get("/prompt")
 async def invoke_prompt(prompt:str='ENT',context:str='Claim details'):
-    try:
-        response = invoke_llm(prompt, context)
-        return { "response": response }
-    except Exception as e:
-        return {"error": str(e)}
+    response = await invoke_llm(prompt, context)
+    return { "response": response }
+
+@api_lc_pt_fastapi.get("/prompt_stream")
+async def invoke_prompt_stream(prompt:str='ENT',context:str='Claim details'):
+    # tokens are written as they arrive instead of after the full generation
+    template = get_prompt()
+    stream = get_llm().astream(template.format(prompt=prompt, context=context))
+    return StreamingResponse(stream_events(stream), media_type="text/event-stream")
+
+async def stream_events(stream):
+    async for chunk in stream:
+        if chunk.content:
+            yield sse_event(chunk.content)
+
+async def invoke_llm(prompt:str,context:str):
+    llm = get_llm()
+    template = get_prompt()
+    response = await llm.ainvoke(template.format(prompt=prompt, context=context))
+    return response
 
-def invoke_llm(prompt:str,context:str):
-    try:
-        llm = get_llm()
-        prompt = get_prompt()
-        response = llm.invoke(prompt.format(prompt=prompt, context=context))
-        return response
-    except Exception as e:
-        return {"error": str(e)}
                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                        
+@lru_cache(maxsize=1)
 def get_prompt():
     prompt = PromptTemplate(
         input_variables=["prompt", "context"],
@@ -56,11 +70,13 @@ def get_prompt():
 def get_model_name()->str:
     return settings.open_ai_model_name
 
+@lru_cache(maxsize=1)
 def get_llm():
     model_name = get_model_name()
     client = ChatOpenAI(model=model_name,
                         temperature=0.3,
-                        openai_api_key=settings.open_ai_key)
+                        openai_api_key=settings.open_ai_key,
+                        **llm_client_kwargs())
     # Note : ChatOpenAI automatically reads the key from the con fig
     # other wise we can set 
     return client
@@ -3,8 +3,10 @@
 This module demonstrates the use of FastAPI's APIRouter, which is a tool for organizing API endpoints into modular, reusable components. APIRouter allows you to group related routes, apply common dependencies, and improve code maintainability and scalability in larger FastAPI applications.
 """
 # APIRouter helps organize endpoints, making code modular and maintainable. It allows grouping related routes, applying shared dependencies, and separating concerns, which is essential for scalable and readable FastAPI projects, especially as the number of endpoints grows in complex applications.
+from functools import lru_cache
 from fastapi import APIRouter
 from app.core.config import settings
+from app.core.openai_client import llm_client_kwargs
 from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 
@@ -19,25 +21,20 @@ async def default():
 
 @api_lc_pt_01_fastapi.get("/fromtemplate")
 async def from_template(request:str='What is UB claim ?',context:str='Insurance details'):
-    try:
-        response = invoke_llm(request, context)
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
+    response = await invoke_llm(request, context)
+    return response
     
 
-def invoke_llm(request:str,context:str):
-    try:
-        prompt = get_prompt()
-        llm = get_llm()
-        response = llm.invoke(prompt.format(request=request, context=context))
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
+async def invoke_llm(request:str,context:str):
+    prompt = get_prompt()
+    llm = get_llm()
+    response = await llm.ainvoke(prompt.format(request=request, context=context))
+    return response
 
 def get_model_name():
     return settings.open_ai_model_name
 
+@lru_cache(maxsize=1)
 def get_prompt():
     # Creates and returns a PromptTemplate object with a template that formats a prompt using provided context and question.
 
@@ -65,6 +62,7 @@ def get_prompt():
                                             """)
     return prompt
 
+@lru_cache(maxsize=1)
 def get_llm():
     """
     Initializes and returns a ChatOpenAI language model instance using the specified model name and API key.
@@ -78,5 +76,6 @@ def get_llm():
     model_name = get_model_name()
     #
     llm = ChatOpenAI(model_name=model_name,temperature=0.3,
-                     openai_api_key=settings.open_ai_key)
+                     openai_api_key=settings.open_ai_key,
+                     **llm_client_kwargs())
     return llm
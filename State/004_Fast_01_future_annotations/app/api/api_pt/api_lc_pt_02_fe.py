@@ -1,8 +1,8 @@
-from click import prompt
+from functools import lru_cache
 from fastapi import APIRouter
-from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 from app.core.config import settings
+from app.core.openai_client import llm_client_kwargs
 
 
 api_lc_pt_02_fe_router = APIRouter()
@@ -15,25 +15,21 @@ async def default():
 
 @api_lc_pt_02_fe_router.get("/from_example")
 async def from_example(prompt: str='What is ENT claim?'):
-    try:
-        response = invoke_llm(prompt)
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
+    response = await invoke_llm(prompt)
+    return response
     
-def invoke_llm(question:str):
-    try:
-        prompt = get_prompt()
-        llm = get_llm()
-        response = llm.invoke(prompt.format(question=question, words=50))
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
+async def invoke_llm(question:str):
+    prompt = get_prompt()
+    response = await get_llm().ainvoke(prompt.format(question=question, words=50))
+    return response
 
+
+@lru_cache(maxsize=1)
 def get_llm():
     model = get_model_name()
     llm = ChatOpenAI(model_name=model,temperature=0.3,
-                    openai_api_key=settings.open_ai_key)
+                    openai_api_key=settings.open_ai_key,
+                    **llm_client_kwargs())
     return llm
 
 def get_model_name():
@@ -55,7 +51,7 @@ def get_exmaples():
 
 
 def _normalize_examples(examples):
-    """Convert dict examples to formatted strings to keep PromptTemplate.from_examples() happy."""
+    """Convert dict examples to formatted "Question/Answer" strings."""
     if not examples:
         return []
     if isinstance(examples[0], dict):
@@ -73,21 +69,14 @@ def get_exmaples_old():
     return examples
 
 
-def get_prompt_template():
-    prompt = PromptTemplate.from_template("Question: {question}\nAnswer: {answer}")
-    return prompt
-
-
-def get_prompt():
-    examples = get_exmaples()
-    ex_prompt = get_prompt_template()
-    prompt = PromptTemplate.from_examples(
-        examples=examples,
-        example_prompt=ex_prompt,
-        suffix="Question: {question}\nAnswer:   , Note: Max response length is {words} words.",
-        input_variables=["question","words"]
-    )
-    return prompt
+@lru_cache(maxsize=1)
+def get_prompt()->str:
+    # Render the few-shot block once; each request only fills {question} and {words}.
+    # Instructions and examples form a stable prefix, the question goes at the tail.
+    examples = "\n\n".join(ex.replace("{", "{{").replace("}", "}}") for ex in get_exmaples())
+    return ("Note: Max response length is {words} words.\n\n"
+            + examples
+            + "\n\nQuestion: {question}\nAnswer:")
 
 
 
@@ -1,10 +1,16 @@
-from email.mime import base
-from urllib import response
+from functools import lru_cache
+from pathlib import Path
 from fastapi import APIRouter
 from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 from app.core.config import settings
-import os
+from app.core.openai_client import llm_client_kwargs
+
+PROMPT_DIR = Path(settings.app_path) / "files" / "prompts"
+DEFAULT_PROMPT_FILE = "claim_prompt.txt"
+# prompt files served by this router, loaded at startup by app/core/warmup.py
+PROMPT_FILES = ("claim_prompt.txt", "sravan_vegetable.txt", "prasanna_chandra.txt")
+MAX_WORDS = "50"
 
 api_lc_pt_03_ff_router = APIRouter()
 
@@ -17,59 +23,49 @@ async def default():
 @api_lc_pt_03_ff_router.get("/Insurance_domain")
 async def invoke_prompt(prompt:str='What types of UB forms ?'
                         ,context:str='Insurance domain'):
-    try:
-        file_name = "claim_prompt.txt"
-        response = invoke_llm(prompt, context, file_name= file_name)
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
+    file_name = "claim_prompt.txt"
+    response = await invoke_llm(prompt, context, file_name= file_name)
+    return response
 
 
 @api_lc_pt_03_ff_router.get("/Agribusiness")
 async def sravan_invoke_prompt(prompt:str='Best vegetable wender ?'
                         ,context:str='Vegetable domain'):
-    try:
-        file_name = "sravan_vegetable.txt"
-        response = invoke_llm(prompt, context, file_name= file_name)
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
+    file_name = "sravan_vegetable.txt"
+    response = await invoke_llm(prompt, context, file_name= file_name)
+    return response
 
 
 @api_lc_pt_03_ff_router.get("/FilmAndTelevisionProduction")
 async def prasanna_invoke_prompt(prompt:str='What is Movie ?'
                         ,context:str='Movie or Film industry'):
-    try:
-        file_name = "prasanna_chandra.txt"
-        response = invoke_llm(prompt, context, file_name= file_name)
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
-
-
-def invoke_llm(que:str, context:str, file_name:str=""):
-    try:
-        llm = get_llm()
-        prompt = get_prompt(file_name)
-        response =  llm.invoke(prompt.format(question=que, context=context, max_words="50"))
-        return response
-    except Exception as ex:
-        return {"error": str(ex)}
+    file_name = "prasanna_chandra.txt"
+    response = await invoke_llm(prompt, context, file_name= file_name)
+    return response
 
-def get_prompt(file_name:str):
 
-    prompt = PromptTemplate.from_file(
-        template_file=get_prompt_file_path(file_name)
-        #input_variables = ["question","context","words"]
-    )
+async def invoke_llm(que:str, context:str, file_name:str=""):
+    prompt = get_prompt(file_name)
+    response = await get_llm().ainvoke(prompt.format(question=que, context=context))
+    return response
+
+
+@lru_cache(maxsize=None)
+def get_prompt(file_name:str):
+    # read each prompt file once per process, explicit utf-8 so Windows and Linux agree
+    template = get_prompt_file_path(file_name).read_text(encoding="utf-8")
+    # static fields are bound once; requests only fill question and context
+    prompt = PromptTemplate.from_template(template).partial(max_words=MAX_WORDS)
     return prompt
 
 
 
 
+@lru_cache(maxsize=1)
 def get_llm():
     llm = ChatOpenAI(model_name=get_model_name(), temperature=0,
-                     openai_api_key=get_open_ai_key())
+                     openai_api_key=get_open_ai_key(),
+                     **llm_client_kwargs())
     return llm
 
 def get_model_name():
@@ -78,10 +74,8 @@ def get_model_name():
 def get_open_ai_key():
     return settings.open_ai_key
 
-def get_prompt_file_path(file_name:str):
+def get_prompt_file_path(file_name:str)->Path:
     if file_name == "":
-        file_name = "claim_prompt.txt"
-    filepath = file_name
-    prompt_file_path = os.path.join(settings.app_path, "files\prompts", filepath)
-    return prompt_file_path
+        file_name = DEFAULT_PROMPT_FILE
+    return PROMPT_DIR / file_name
 
@@ -1,11 +1,13 @@
-import json
 # This module defines the FastAPI router for the `api_pt` endpoints, which provide
 # APIs for interacting with OpenAI's language models and retrieving application configuration.
 # Endpoints included:
 # - `/` : Returns a default response to verify the API is running.
-# - `/config` : Returns current application and database configuration settings.
+# - `/config` : Returns current application and database configuration settings (secrets excluded).
 # - `/mock_prompt` : Returns a mock prompt for testing purposes.
 # - `/prompt` : Invokes the OpenAI API with a user prompt and context, returning the model's response.
+# - `/prompt_batch` : Invokes the OpenAI API concurrently for a list of prompts sharing one context.
+# - `/prompt/batch` : Same, for a list of (question, context) pairs; duplicates are sent once.
+# - `/prompt_stream` : Streams the OpenAI response as server-sent events while it is generated.
 # Helper functions are provided for:
 # - Constructing OpenAI client instances.
 # - Formatting prompts and messages for the OpenAI API.
@@ -13,15 +15,47 @@ import json
 # This router is intended for use in applications that require AI-powered responses,
 # such as a medical insurance assistant, and demonstrates best practices for
 # asynchronous API design and integration with external AI services.
-from fastapi import APIRouter
-from openai import OpenAI
+import asyncio
+from functools import lru_cache
+from string import Template
+from typing import List
+import orjson
+from fastapi import APIRouter, Response
+from fastapi.responses import StreamingResponse
+from openai import AsyncOpenAI, NOT_GIVEN
 from app.core.config import  settings 
+from app.core.llm_cache import create_response_cache, is_cache_enabled, make_cache_key
+from app.core.semantic_cache import semantic_cache, is_semantic_cache_enabled
+from app.core.single_flight import SingleFlight
+from app.core.openai_client import client as openai_client
+from app.core.responses import ORJSONResponse, sse_event
+from app.models.common.prompts.prompt_model import PromptRequest
  
 
 
 ''' wirte a comment'''
 api_pt_router = APIRouter()
 
+# Static instructions live in the system message so every request shares the same
+# prompt prefix (OpenAI prompt caching); only the user message varies per call.
+SYSTEM_PROMPT = (
+    "You are an expert medical insurance assistant.\n"
+    "Answer clearly and professionally.\n"
+    "Note: Provide response in max 50 words only"
+)
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+_RESPONSE_CACHE = create_response_cache()
+# identical prompts already on their way to OpenAI share one call
+_SINGLE_FLIGHT = SingleFlight()
+TEMPERATURE = 0.3
+# Routes requests sharing SYSTEM_PROMPT to the same OpenAI prompt-cache shard;
+# bump the version whenever SYSTEM_PROMPT changes.
+PROMPT_CACHE_KEY = "medical-ins-v1"
+# Settings are immutable after startup; only these non-secret keys are served over HTTP
+_CONFIG_KEYS = ("env", "app_name", "host", "port", "db_host", "db_port", "db_name", "log_level")
+_CONFIG_CACHE = settings.model_dump(include=set(_CONFIG_KEYS))
+_DEFAULT_RESPONSE = orjson.dumps({"message": "Default response from api_pt"})
+
 
 '''
 /api_pt
@@ -32,9 +66,9 @@ async def get_default_async():
     Asynchronously returns a default response message for the api_pt endpoint.
 
     Returns:
-        dict: A dictionary containing a default message.
+        Response: JSON with a default message, encoded once at import.
     """
-    return {"message": "Default response from api_pt"}
+    return Response(content=_DEFAULT_RESPONSE, media_type="application/json")
 
 @api_pt_router.get("/config")
 async def get_status():
@@ -42,23 +76,9 @@ async def get_status():
     Asynchronously retrieves the current application and database configuration settings.
 
     Returns:
-        dict: A dictionary containing environment, OpenAI key, application name, host, port,
-              database host, port, name, user, password, and log level.
-    """
-    var_settings = {
-        "env": settings.env,
-        "open_ai_key": settings.open_ai_key,
-        "app_name": settings.app_name,
-        "host": settings.host,
-        "port": settings.port,
-        "db_host": settings.db_host,
-        "db_port": settings.db_port,
-        "db_name": settings.db_name,
-        "db_user": settings.db_user,
-        "db_password": settings.db_password,
-        "log_level": settings.log_level,
-    }
-    return var_settings
+        dict: The snapshot of `_CONFIG_KEYS` taken at import; credentials, URLs and paths are never included.
+    """
+    return _CONFIG_CACHE
 
 @api_pt_router.get("/mock_prompt")
 async def get_mock_prompt(mock_prompt: str):
@@ -86,55 +106,200 @@ async def get_prompt(prompt: str='Hyderabad',context: str='City in India'):
     Returns:
         dict: A dictionary with the key 'prompt' and the input string as its value.
     """
-    try:
-        response = invoke_open_ai(question=prompt, context=context)
-        return response
-    except Exception as e:
-        return {"error": str(e)}    
+    response = await invoke_open_ai(question=prompt, context=context)
+    # already JSON-ready, so skip FastAPI's jsonable_encoder pass
+    return ORJSONResponse(response)
+
+
+@api_pt_router.post("/prompt_batch")
+async def get_prompt_batch(prompts: List[str], context: str='City in India'):
+    """
+    Asynchronously invokes the OpenAI API for every prompt in the list and returns the
+    responses in the same order. Calls overlap on the event loop, bounded by
+    `settings.open_ai_max_concurrency`.
+
+    Args:
+        prompts (List[str]): The input prompt strings.
+        context (str): Context shared by all prompts.
+
+    Returns:
+        list: One OpenAI response (or {"error": ...}) per prompt.
+    """
+    return ORJSONResponse(await invoke_open_ai_many([(prompt, context) for prompt in prompts]))
+
+
+@api_pt_router.post("/prompt/batch")
+async def get_prompt_pairs_batch(requests: List[PromptRequest]):
+    """
+    Asynchronously answers a list of (question, context) pairs in one HTTP request.
+    Identical pairs are sent to OpenAI once.
+
+    Args:
+        requests (List[PromptRequest]): The questions, each with its own context.
+
+    Returns:
+        list: One OpenAI response (or {"error": ...}) per request, in order.
+    """
+    return ORJSONResponse(await invoke_open_ai_many([(r.question or "", r.context or "")
+                                                     for r in requests]))
+
+
+@api_pt_router.get("/prompt_stream")
+async def get_prompt_stream(prompt: str='Hyderabad',context: str='City in India'):
+    """
+    Asynchronously streams the OpenAI response for the prompt as server-sent events,
+    one event per generated token delta, so clients see the first tokens immediately.
+
+    Args:
+        prompt (str): The input prompt string.
+        context (str): Additional context for the prompt.
+
+    Returns:
+        StreamingResponse: A `text/event-stream` of the model's content deltas.
+    """
+    stream = await invoke_open_ai_stream(question=prompt, context=context)
+    return StreamingResponse(stream_events(stream), media_type="text/event-stream")
 
 '''
 open ai key 
 '''
-def invoke_open_ai(question: str, context: str):
+async def invoke_open_ai(question: str, context: str):
     """
     Invokes the OpenAI chat completion API with a given question and context.
     Args:
         question (str): The user's question to be answered by the model.
         context (str): Additional context or information to provide to the model.
     Returns:
-        str: The generated response from the OpenAI model.
+        dict: The OpenAI chat completion (`model_dump(mode="json")`), served from the response cache
+              when the same prompt was answered before, or shared with an identical request
+              that is still in flight.
     Notes:
         The `temperature` parameter controls the randomness of the model's output.
         Lower values (e.g., 0.3) make the output more focused and deterministic,
         while higher values (e.g., 0.8) make the output more diverse and creative.
     """
-    PROMPT_TEMPLATE = get_prompt_template()
-    prompt = PROMPT_TEMPLATE.format(
-        question=question,
-        context=context
-    )
+    prompt = format_prompt(question, context)
+    cache_key = make_cache_key(get_model_name(), TEMPERATURE, SYSTEM_PROMPT, prompt)
+    return await _SINGLE_FLIGHT.do(cache_key, lambda: fetch_open_ai(question, context, prompt, cache_key))
+
+
+async def fetch_open_ai(question: str, context: str, prompt: str, cache_key: str):
+    """
+    Answers one prompt from the caches or OpenAI; runs once per key at a time (see `invoke_open_ai`).
+    Args:
+        question (str): The user's question.
+        context (str): Additional context for the question.
+        prompt (str): The user prompt built by `format_prompt`.
+        cache_key (str): The response cache key of the prompt.
+    Returns:
+        dict: The OpenAI chat completion as JSON-ready dict.
+    """
+    if is_cache_enabled():
+        response = await _RESPONSE_CACHE.get(cache_key)
+        if response is not None:
+            return response
+    vector = None
+    if is_semantic_cache_enabled():
+        vector = await semantic_cache.embed(f"{question}\n{context}")
+        response = semantic_cache.get(vector)
+        if response is not None:
+            return response
     messages = get_messages(prompt)
+    completion = await create_completion(messages)
+    response = completion.model_dump(mode="json")
+    if is_cache_enabled():
+        await _RESPONSE_CACHE.set(cache_key, response)
+    if vector is not None:
+        semantic_cache.set(vector, response)
+
+    return response
+    # return response.choices[0].message.content
+
+async def invoke_open_ai_many(pairs: List[tuple]):
+    """
+    Invokes `invoke_open_ai` for many (question, context) pairs concurrently, bounded by
+    `settings.open_ai_max_concurrency`. Duplicate pairs share one call.
+    Args:
+        pairs (List[tuple]): (question, context) pairs.
+    Returns:
+        list: One response (or {"error": ...}) per pair, in input order.
+    """
+    semaphore = asyncio.Semaphore(get_max_concurrency())
+
+    async def invoke_limited(question: str, context: str):
+        async with semaphore:
+            return await invoke_open_ai(question=question, context=context)
+
+    unique = list(dict.fromkeys(pairs))
+    responses = await asyncio.gather(*[invoke_limited(q, c) for q, c in unique],
+                                     return_exceptions=True)
+    results = {pair: {"error": str(r)} if isinstance(r, Exception) else r
+               for pair, r in zip(unique, responses)}
+    return [results[pair] for pair in pairs]
+
+async def invoke_open_ai_stream(question: str, context: str):
+    """
+    Invokes the OpenAI chat completion API in streaming mode.
+    Args:
+        question (str): The user's question to be answered by the model.
+        context (str): Additional context or information to provide to the model.
+    Returns:
+        AsyncStream: The stream of completion chunks.
+    """
+    prompt = format_prompt(question, context)
+    client = get_openai_client()
+    return await client.chat.completions.create(
+        model=get_model_name(),
+        messages=get_messages(prompt),
+        temperature=TEMPERATURE,
+        prompt_cache_key=get_prompt_cache_key(),
+        stream=True
+    )
+
+
+async def stream_events(stream):
+    """
+    Converts OpenAI completion chunks into server-sent event frames.
+    Args:
+        stream (AsyncStream): The stream returned by `invoke_open_ai_stream`.
+    Yields:
+        str: One `data:` frame per non-empty content delta.
+    """
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        content = chunk.choices[0].delta.content
+        if content:
+            yield sse_event(content)
+
+
+async def create_completion(messages: list):
+    """
+    Sends one chat completion on the shared client.
+
+    Args:
+        messages (list): Message list built by `get_messages`.
+
+    Returns:
+        ChatCompletion: The OpenAI response.
+    """
     client = get_openai_client()
-    model_name = get_model_name()
-    response = client.chat.completions.create(
-        model=model_name,   # or gpt-4.1, gpt-4o
+    return await client.chat.completions.create(
+        model=get_model_name(),   # or gpt-4.1, gpt-4o
         messages=messages,
-        temperature=0.3 # what is temperature
+        temperature=TEMPERATURE, # what is temperature
+        prompt_cache_key=get_prompt_cache_key()
     )
 
-    return response
-    # return response.choices[0].message.content
 
-def get_openai_client()->OpenAI:
+def get_openai_client()->AsyncOpenAI:
     """
-    Creates and returns an instance of the OpenAI client using the API key retrieved from the environment or configuration.
+    Returns the shared async OpenAI client (pooled HTTP/2 connections, created once per process).
 
     Returns:
-        OpenAI: An authenticated OpenAI client instance.
+        AsyncOpenAI: An authenticated async OpenAI client instance.
     """
-    open_ai_key = get_openai_key()
-    client = OpenAI(api_key=open_ai_key)
-    return client
+    return openai_client
 
 def get_openai_key()->str:
     """
@@ -145,6 +310,15 @@ def get_openai_key()->str:
     """
     return settings.open_ai_key
 
+def get_max_concurrency()->int:
+    """
+    Returns the maximum number of OpenAI calls a single batch request may run at once.
+
+    Returns:
+        int: The concurrency limit from the application settings.
+    """
+    return settings.open_ai_max_concurrency
+
 def get_model_name()->str:
     """
     Returns the name of the OpenAI model specified in the application settings.
@@ -154,25 +328,41 @@ def get_model_name()->str:
     """
     return settings.open_ai_model_name
 
-def get_prompt_template()->str:
-    '''Returns a prompt template string for a medical insurance assistant.
-    The template includes placeholders for a user question and relevant context,
-    and instructs the assistant to answer clearly and professionally in no more than 50 words.
+def get_prompt_cache_key():
+    """
+    Returns the OpenAI `prompt_cache_key`, or NOT_GIVEN for self-hosted backends
+    that do not know the parameter.
+    """
+    return PROMPT_CACHE_KEY if settings.llm_backend == "openai" else NOT_GIVEN
+
+@lru_cache(maxsize=1)
+def get_prompt_template()->Template:
+    '''Returns the user prompt template for a medical insurance assistant.
+    The template only holds the per-request placeholders for a user question and relevant context;
+    the static instructions are sent once in SYSTEM_MESSAGE.
+    It is compiled once into a `string.Template`, so each request only substitutes values.
     Returns:
-        str: The formatted prompt template string.'''
-    PROMPT_TEMPLATE = """
-    You are an expert medical insurance assistant.
+        Template: The compiled prompt template.'''
+    PROMPT_TEMPLATE = """User Question:
+$question
 
-    User Question:
-    {question}
+Relevant Context:
+$context"""
+    return Template(PROMPT_TEMPLATE)
 
-    Relevant Context:
-    {context}
 
-    Answer clearly and professionally.
-    Note: Provide response in max 50 words only
+def format_prompt(question: str, context: str)->str:
+    """
+    Fills the user prompt template with a question and its context.
+
+    Args:
+        question (str): The user's question.
+        context (str): Additional context for the question.
+
+    Returns:
+        str: The user prompt sent to the model.
     """
-    return PROMPT_TEMPLATE
+    return get_prompt_template().substitute(question=question, context=context)
 
 
 def get_messages(prompt: str):
@@ -185,9 +375,11 @@ def get_messages(prompt: str):
     Returns:
         list: A list of dictionaries representing the conversation messages, 
               including a system prompt and the user's message.
+              The static system prompt is always first and the dynamic user message last,
+              which keeps the shared prefix cacheable by the provider.
     """
     messages=[
-            {"role": "system", "content": "You are a helpful AI assistant"},
+            SYSTEM_MESSAGE,
             {"role": "user", "content": prompt}
         ]
     return messages
@@ -1,8 +1,11 @@
  
 from __future__ import annotations
-from click import prompt
+import threading
+from functools import lru_cache
+from cachetools import TTLCache
 from fastapi import APIRouter
 from app.core.config import settings
+from app.core.openai_client import llm_client_kwargs
 from app.models.common.prompts.prompt_model import (PromptRequest, 
                                                     PromptResponse,
                                                     PromptModel)
@@ -20,33 +23,39 @@ async def get_default():
 
 @router_buffer_memory.post("/mock")
 async def post_default(request:PromptRequest)->PromptResponse:
-    response = PromptResponse()
-    try:
-        model = PromptModel()
-        model.request = request
-        model.response = response
-    except Exception as ex:
-        response.Message = {"error": str(ex)}
+    response = PromptResponse.model_construct()
+    model = PromptModel.model_construct()
+    model.request = request
+    model.response = response
     return response
 
 
 @router_buffer_memory.post("/prompt")
 async def post_default(request:PromptRequest)->PromptResponse:
-    response = PromptResponse()
-    try:
-        model = PromptModel()
-        model.request = request
-        model.response = response
-    except Exception as ex:
-        response.Message = {"error": str(ex)}
+    response = PromptResponse.model_construct()
+    model = PromptModel.model_construct()
+    model.request = request
+    model.response = response
     return response
 
 
-store = {}
+# Bounded, expiring per-process history store. Stays a sync function because
+# RunnableWithMessageHistory calls it synchronously (possibly from a worker thread),
+# hence a threading lock rather than asyncio.Lock.
+store = TTLCache(maxsize=settings.session_store_maxsize, ttl=settings.session_ttl_s)
+_store_lock = threading.Lock()
+
 def get_session_history(session_id:str):
-    if session_id not in store:
-        store[session_id] = InMemoryChatMessageHistory()
-    return store[session_id]
+    if settings.session_store == "redis":
+        # shared by all workers; langchain_community is only needed for this backend
+        from langchain_community.chat_message_histories import RedisChatMessageHistory
+        return RedisChatMessageHistory(session_id, url=settings.session_redis_url,
+                                       ttl=settings.session_ttl_s)
+    with _store_lock:
+        history = store.get(session_id)
+        if history is None:
+            history = store[session_id] = InMemoryChatMessageHistory()
+        return history
 
 
  
@@ -62,9 +71,11 @@ def get_session_history(session_id:str):
 #     return model
 
 
+@lru_cache(maxsize=1)
 def get_llm():
     llm = ChatOpenAI(model_name=get_model_name(), temperature=0,
-                     openai_api_key=get_open_ai_key())
+                     openai_api_key=get_open_ai_key(),
+                     **llm_client_kwargs())
     return llm
 
 def get_model_name():
@@ -15,7 +15,7 @@ async def default_user():
 
 @user_router.get("user")
 async def default_user(request:UserRequest):
-    response = UserResponse()
+    response = UserResponse.model_construct()
     try:
         return {"response"," api "}
     except Exception as ex:
@@ -1,17 +1,18 @@
-from   fastapi import Depends
-from app.dal.dependencies_dal import get_map_user
 from app.common.dependencies_common import get_user_validation_utility
 from app.services.user_service import UserService
 from app.dal.repositories.user_repository import UserRepository
-from app.dal.connections.sql_connection import get_db
+from app.dal.repositories.dependencies import get_user_repo
 
 
 
-def get_user_repository(db = Depends(get_db), map_user = Depends(get_map_user)):
-    user_repository = UserRepository(db, map_user)
-    return user_repository
+# Built once at import: neither object holds per-request state (the DB session is
+# passed to each call), so FastAPI does not need to rebuild them per request.
+user_service = UserService(get_user_repo(), get_user_validation_utility())
 
 
-def get_user_service(user_repository = Depends(get_user_repository),
-                     user_validation_utility = Depends(get_user_validation_utility)):
-    return UserService(user_repository, user_validation_utility)
+def get_user_repository() -> UserRepository:
+    return get_user_repo()
+
+
+def get_user_service() -> UserService:
+    return user_service
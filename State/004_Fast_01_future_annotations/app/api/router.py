@@ -1,43 +1,65 @@
+import sys
+from importlib import import_module
 from fastapi import APIRouter
+from app.core.config import settings
 """
 This module defines the main API router for the application.
-It imports the FastAPI APIRouter and includes the `api_pt_router` from the Portuguese API module
-under the `/api_pt` prefix. This allows all endpoints defined in `api_pt_router` to be accessible
-under the `/api_pt` path.
+Sub-routers are declared in the `ROUTES` table as `(name, prefix, "module.path:router_name")`
+and imported on demand, so only the routers enabled through the `ENABLED_ROUTES` setting
+(comma separated names, `*` for all) load their modules (LangChain, OpenAI, SQLAlchemy).
+The database engine is only built when a DB-backed router imports `DB_MODULE`; startup code
+checks `db_loaded()` instead of importing it, so the app runs without ODBC when those routers
+are disabled.
 Attributes:
-    api_router (APIRouter): The main API router that includes sub-routers for different API sections.
+    ROUTES (list): Route table of every sub-router the API can expose.
+    DB_MODULE (str): Module that builds the SQLAlchemy engine on import.
+    api_router (APIRouter): The main API router that includes the enabled sub-routers.
 """
-from app.api.api_pt.api_pt import api_pt_router
-from app.api.api_pt.api_lc_pt import api_lc_pt_fastapi
-from app.api.api_pt.api_lc_pt_01_ft import api_lc_pt_01_fastapi
-from app.api.api_pt.api_lc_pt_02_fe import api_lc_pt_02_fe_router
-from app.api.api_pt.api_lc_pt_03_ff import api_lc_pt_03_ff_router
-from app.api.api_pt.api_lc_pt_04_ff import api_lc_pt_04_ff_router
-
-from app.api.api_cpt.api_lc_cpt_01_ft import api_lc_cpt_01_ft_router
-from app.api.api_cpt.api_lc_cpt_02_fm import api_lc_cpt_02_fm_router
-from app.api.api_cpt.api_lc_cpt_02_sthm import api_lc_cpt_02_sthm_router
-
-from app.api.api_fspt.api_lc_fspt_01_ft import api_lc_fspt_01_ft_router
-from app.api.api_fspt.api_lc_fspt_02_fcpt_mp_v2 import api_lc_fspt_mp_router 
-from app.api.api_mange_user.router_user import module_user_router
-
-from app.api.api_state.router_api_state import sub_base_router_state
-
-api_router = APIRouter()
-api_router.include_router(api_pt_router, prefix="/api_pt")
-api_router.include_router(api_lc_pt_fastapi, prefix="/api_lc_pt")
-api_router.include_router(api_lc_pt_01_fastapi, prefix="/api_lc_pt_01")
-api_router.include_router(api_lc_pt_02_fe_router, prefix="/api_lc_pt_02_fe")
-api_router.include_router(api_lc_pt_04_ff_router, prefix="/api_lc_pt_04_ff")
-api_router.include_router(api_lc_pt_03_ff_router, prefix="/api_lc_pt_03_ff")
-
-api_router.include_router(api_lc_cpt_01_ft_router, prefix="/api_lc_cpt_01_ft")
-api_router.include_router(api_lc_cpt_02_fm_router, prefix="/api_lc_cpt_02_fm")
-api_router.include_router(api_lc_cpt_02_sthm_router, prefix="/api_lc_cpt_02_sthm")
-
-api_router.include_router(api_lc_fspt_01_ft_router, prefix="/api_lc_fspt_01_ft")
-api_router.include_router(api_lc_fspt_mp_router, prefix="/api_lc_fspt_02_fcpt_mp")
-
-api_router.include_router(module_user_router)
-api_router.include_router(sub_base_router_state)
\ No newline at end of file
+
+ROUTES = [
+    ("api_pt", "/api_pt", "app.api.api_pt.api_pt:api_pt_router"),
+    ("api_lc_pt", "/api_lc_pt", "app.api.api_pt.api_lc_pt:api_lc_pt_fastapi"),
+    ("api_lc_pt_01", "/api_lc_pt_01", "app.api.api_pt.api_lc_pt_01_ft:api_lc_pt_01_fastapi"),
+    ("api_lc_pt_02_fe", "/api_lc_pt_02_fe", "app.api.api_pt.api_lc_pt_02_fe:api_lc_pt_02_fe_router"),
+    ("api_lc_pt_04_ff", "/api_lc_pt_04_ff", "app.api.api_pt.api_lc_pt_04_ff:api_lc_pt_04_ff_router"),
+    ("api_lc_pt_03_ff", "/api_lc_pt_03_ff", "app.api.api_pt.api_lc_pt_03_ff:api_lc_pt_03_ff_router"),
+
+    ("api_lc_cpt_01_ft", "/api_lc_cpt_01_ft", "app.api.api_cpt.api_lc_cpt_01_ft:api_lc_cpt_01_ft_router"),
+    ("api_lc_cpt_02_fm", "/api_lc_cpt_02_fm", "app.api.api_cpt.api_lc_cpt_02_fm:api_lc_cpt_02_fm_router"),
+    ("api_lc_cpt_02_sthm", "/api_lc_cpt_02_sthm", "app.api.api_cpt.api_lc_cpt_02_sthm:api_lc_cpt_02_sthm_router"),
+
+    ("api_lc_fspt_01_ft", "/api_lc_fspt_01_ft", "app.api.api_fspt.api_lc_fspt_01_ft:api_lc_fspt_01_ft_router"),
+    ("api_lc_fspt_02_fcpt_mp", "/api_lc_fspt_02_fcpt_mp", "app.api.api_fspt.api_lc_fspt_02_fcpt_mp_v2:api_lc_fspt_mp_router"),
+
+    ("manage_user", "", "app.api.api_mange_user.router_user:module_user_router"),
+    ("state", "", "app.api.api_state.router_api_state:sub_base_router_state"),
+]
+
+DB_MODULE = "app.dal.connections.sql_connection"
+
+
+def db_loaded() -> bool:
+    return DB_MODULE in sys.modules
+
+
+def get_enabled_routes() -> set[str] | None:
+    if settings.enabled_routes.strip() == "*":
+        return None
+    return {name.strip() for name in settings.enabled_routes.split(",") if name.strip()}
+
+
+def load_router(target: str) -> APIRouter:
+    module_name, router_name = target.split(":")
+    return getattr(import_module(module_name), router_name)
+
+
+def build_api_router() -> APIRouter:
+    enabled = get_enabled_routes()
+    router = APIRouter()
+    for name, prefix, target in ROUTES:
+        if enabled is None or name in enabled:
+            router.include_router(load_router(target), prefix=prefix)
+    return router
+
+
+api_router = build_api_router()
@@ -6,48 +6,11 @@ class UserValidationUtility():
     
     
     
-    def validate_user_request(self, model:UserModel)->UserModel:
-        if model == None:
-            model = UserModel()
-            model.IsInvalid = True
-            model.Message = "Invalid user model"
-            return model
-        request = model.request
-        if request == None:
-            model.request = UserRequest()
-            model.request.IsInvalid = True
-            model.request.Message = "Invalid user request"
-            model.IsInvalid = True
-            model.Message = "Invalid user request"
-            return model
-        
-        if request.UserId <= 0:
-            model.IsInvalid = True
-            model.Message = "Invalid user Id"
-            return model
-        
-        model.item = UserItem()
-        model.item.Id = request.Id
-        model.item.UserId = request.UserId
-        model.item.Name = request.Name
-        model.IsInvalid = False
-        
-        return model
-    
-    
-
-
-
-
     def validate_user_model(self, model:UserModel)->UserModel:
-        if model == None:
-            model = UserModel()
-            model.IsInvalid = True
-            model.Message = "Invalid user model"
-            return model
-        if model.item == None:
-            model.item = UserItem()
+        # request fields are validated by CreateUserRequest (pydantic); only the item is checked here
+        if model is None:
+            return UserModel(IsInvalid=True, Message="Invalid user model")
+        if model.item is None:
             model.IsInvalid = True
             model.Message = "Invalid user item"
-            return model
         return model
\ No newline at end of file
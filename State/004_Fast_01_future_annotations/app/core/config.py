@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pathlib import Path
 
@@ -7,6 +8,22 @@ class Settings(BaseSettings):
     env: str = "development"
     open_ai_key: str = "123"
     open_ai_model_name: str = "gpt-4o-mini"
+    llm_backend: str = "openai"  # openai | vllm (any OpenAI-compatible server)
+    llm_base_url: str | None = None
+    openai_http_transport: str = "httpx"  # httpx | aiohttp
+    open_ai_max_concurrency: int = 8
+    llm_cache: str = "memory"  # none | memory | sqlite | redis
+    llm_cache_maxsize: int = 1024
+    llm_cache_path: str = str(BASE_DIR / ".llm_cache.db")
+    llm_cache_redis_url: str = "redis://localhost:6379/0"
+    llm_cache_ttl_s: int = 3600
+    session_store: str = "memory"  # memory | redis (chat history for api_state)
+    session_store_maxsize: int = 10000
+    session_ttl_s: int = 3600
+    session_redis_url: str = "redis://localhost:6379/0"
+    semantic_cache: bool = False
+    semantic_cache_threshold: float = 0.95
+    semantic_cache_model: str = "sentence-transformers/all-MiniLM-L6-v2"
     app_name: str = "VishAgent API"
     host: str = "0.0.0.0"
     port: int = 825
@@ -16,11 +33,25 @@ class Settings(BaseSettings):
     db_name: str
     db_user: str
     db_password: str
+    db_query_cache_size: int = 1200
     log_level: str = "INFO"
+    access_log: bool = False
+    gzip_min_size: int = 512  # bytes; 0 disables response compression
+    gzip_level: int = 5
+    warmup_enabled: bool = True  # build LLM clients, prompts and a DB connection at startup
+    warmup_llm_ping: bool = False
+    enabled_routes: str = "*"  # comma separated ROUTES names in app/api/router.py
 
     app_path:str=str(BASE_DIR)
 
     class Config:
         env_file = str(BASE_DIR / ".env.dev")
+        # read-only after startup, so derived clients and caches built at import stay valid
+        frozen = True
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    # .env parsing and validation run once per process; every import shares this instance
+    return Settings()
+
+settings = get_settings()
@@ -0,0 +1,33 @@
+"""
+Application-wide exception handlers.
+
+Routes keep a straight-line happy path; failures propagate here instead of being
+caught in every endpoint. Provider throttling and timeouts map to 429/504 so clients
+can back off, anything else becomes a 500 with the same `{"error": ...}` body the
+endpoints used to return.
+"""
+import openai
+from fastapi import FastAPI, Request
+from app.core.responses import ORJSONResponse
+
+DEFAULT_RETRY_AFTER = "1"
+
+
+async def rate_limit_handler(request: Request, exc: openai.RateLimitError):
+    retry_after = exc.response.headers.get("retry-after", DEFAULT_RETRY_AFTER)
+    return ORJSONResponse({"error": str(exc)}, status_code=429,
+                          headers={"Retry-After": retry_after})
+
+
+async def timeout_handler(request: Request, exc: openai.APITimeoutError):
+    return ORJSONResponse({"error": str(exc)}, status_code=504)
+
+
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    return ORJSONResponse({"error": str(exc)}, status_code=500)
+
+
+def register_exception_handlers(app: FastAPI):
+    app.add_exception_handler(openai.RateLimitError, rate_limit_handler)
+    app.add_exception_handler(openai.APITimeoutError, timeout_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
@@ -0,0 +1,103 @@
+"""
+LLM response caching.
+
+LangChain calls (ChatOpenAI) go through the global LangChain LLM cache configured by
+`configure_llm_cache`. Direct OpenAI SDK calls use the cache returned by
+`create_response_cache`: `ResponseCache`, a small in-process LRU, or `RedisResponseCache`
+when responses should be shared across workers. Keys are short blake2b digests built by
+`make_cache_key`. Both are controlled by the `LLM_CACHE` setting: none | memory | sqlite | redis.
+In-process entries expire after `LLM_CACHE_TTL_S`, like the Redis ones.
+"""
+import hashlib
+import orjson
+from cachetools import TTLCache
+from langchain_core.caches import BaseCache
+from langchain_core.globals import set_llm_cache
+from app.core.config import settings
+
+
+def make_cache_key(*parts) -> str:
+    return hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+
+
+class ResponseCache():
+    # LRU with expiry; only touched from the event loop, so no lock is needed
+    def __init__(self, maxsize: int = 1024, ttl: int = 3600):
+        self.maxsize = maxsize
+        self._items = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key):
+        return self._items.get(key)
+
+    async def set(self, key, value):
+        self._items[key] = value
+
+    def clear(self):
+        self._items.clear()
+
+
+class TTLInMemoryCache(BaseCache):
+    # LangChain InMemoryCache with LRU eviction and expiry; async methods stay on the loop
+    def __init__(self, maxsize: int = 1024, ttl: int = 3600):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def lookup(self, prompt: str, llm_string: str):
+        return self._cache.get((prompt, llm_string))
+
+    def update(self, prompt: str, llm_string: str, return_val):
+        self._cache[prompt, llm_string] = return_val
+
+    def clear(self, **kwargs):
+        self._cache.clear()
+
+    async def alookup(self, prompt: str, llm_string: str):
+        return self.lookup(prompt, llm_string)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val):
+        self.update(prompt, llm_string, return_val)
+
+    async def aclear(self, **kwargs):
+        self.clear()
+
+
+class RedisResponseCache():
+    # values must be JSON serializable (e.g. response.model_dump())
+    def __init__(self, url: str, ttl: int, prefix: str = "llm:"):
+        import redis.asyncio as redis
+        self._redis = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, key):
+        value = await self._redis.get(self.prefix + key)
+        return None if value is None else orjson.loads(value)
+
+    async def set(self, key, value):
+        await self._redis.set(self.prefix + key, orjson.dumps(value), ex=self.ttl)
+
+
+def is_cache_enabled() -> bool:
+    return settings.llm_cache != "none"
+
+
+def create_response_cache():
+    if settings.llm_cache == "redis":
+        return RedisResponseCache(settings.llm_cache_redis_url, settings.llm_cache_ttl_s)
+    return ResponseCache(maxsize=settings.llm_cache_maxsize, ttl=settings.llm_cache_ttl_s)
+
+
+def configure_llm_cache():
+    if settings.llm_cache == "memory":
+        set_llm_cache(TTLInMemoryCache(maxsize=settings.llm_cache_maxsize,
+                                       ttl=settings.llm_cache_ttl_s))
+    elif settings.llm_cache == "sqlite":
+        # langchain_community is only needed for the persistent caches
+        from langchain_community.cache import SQLiteCache
+        set_llm_cache(SQLiteCache(database_path=settings.llm_cache_path))
+    elif settings.llm_cache == "redis":
+        from redis import Redis
+        from langchain_community.cache import RedisCache
+        set_llm_cache(RedisCache(Redis.from_url(settings.llm_cache_redis_url),
+                                 ttl=settings.llm_cache_ttl_s))
+    else:
+        set_llm_cache(None)
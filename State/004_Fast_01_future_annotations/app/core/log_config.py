@@ -0,0 +1,50 @@
+"""
+Logging setup.
+
+Uvicorn's per-request access log is off unless ACCESS_LOG=true. When it is on, the request
+path only enqueues the record (QueueHandler); a background QueueListener thread renders it
+as JSON with orjson and writes it out, so log I/O never runs on the event loop thread.
+"""
+import logging
+import logging.handlers
+import queue
+import orjson
+from app.core.config import settings
+
+_listener = None
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        return orjson.dumps({
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }).decode()
+
+
+def configure_logging():
+    global _listener
+    logging.getLogger().setLevel(settings.log_level.upper())
+    access_logger = logging.getLogger("uvicorn.access")
+    if not settings.access_log:
+        # uvicorn skips building access records when INFO is disabled on this logger
+        access_logger.setLevel(logging.WARNING)
+        return
+    if _listener is not None:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(JSONFormatter())
+    log_queue = queue.SimpleQueue()
+    access_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    access_logger.propagate = False
+    _listener = logging.handlers.QueueListener(log_queue, handler)
+    _listener.start()
+
+
+def stop_logging():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
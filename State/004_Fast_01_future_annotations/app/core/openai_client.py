@@ -0,0 +1,61 @@
+"""
+Shared OpenAI SDK client.
+
+One AsyncOpenAI instance per process, backed by a pooled HTTP/2 httpx client so TCP/TLS
+connections to the API are reused (and multiplexed) across requests. Closed from the
+FastAPI lifespan on shutdown.
+
+`OPENAI_HTTP_TRANSPORT=aiohttp` swaps the httpx transport for aiohttp (the SDK's
+`DefaultAioHttpClient`, needs `openai[aiohttp]`), which holds up better under high
+fan-out than httpx's connection pool.
+
+`LLM_BACKEND=vllm` points this client and the LangChain ChatOpenAI instances at a
+self-hosted OpenAI-compatible server (vLLM/TGI) via `get_llm_base_url`.
+
+Every ChatOpenAI is built with `**llm_client_kwargs()`, so all LangChain modules share
+these pools too (plus one sync HTTP/2 pool for sync calls) instead of opening their own.
+"""
+import httpx
+from openai import AsyncOpenAI
+from app.core.config import settings
+
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+HTTP_TIMEOUT = 30
+
+
+def create_http_client() -> httpx.AsyncClient:
+    if settings.openai_http_transport == "aiohttp":
+        # optional extra; the aiohttp client speaks HTTP/1.1 only
+        from openai import DefaultAioHttpClient
+        return DefaultAioHttpClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    return httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+http_client = create_http_client()
+sync_http_client = httpx.Client(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+VLLM_DEFAULT_BASE_URL = "http://localhost:8000/v1"
+
+
+def get_llm_base_url() -> str | None:
+    # None keeps the SDK default (https://api.openai.com/v1)
+    if settings.llm_backend == "vllm":
+        return settings.llm_base_url or VLLM_DEFAULT_BASE_URL
+    return settings.llm_base_url
+
+
+def llm_client_kwargs() -> dict:
+    # ChatOpenAI connection settings: backend URL and the shared HTTP pools
+    return {"base_url": get_llm_base_url(),
+            "http_async_client": http_client,
+            "http_client": sync_http_client}
+
+
+client = AsyncOpenAI(api_key=settings.open_ai_key, base_url=get_llm_base_url(),
+                     http_client=http_client)
+
+
+async def close_openai_client():
+    # also closes http_client, shared with the ChatOpenAI instances
+    await client.close()
+    sync_http_client.close()
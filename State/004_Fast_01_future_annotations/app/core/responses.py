@@ -0,0 +1,35 @@
+"""
+Response classes shared by the API.
+
+ORJSONResponse renders JSON with orjson (C extension) instead of the stdlib `json`
+module; it is the application's default response class (see main.py).
+
+`sse_event` frames text as one server-sent event for the streaming endpoints.
+
+PydanticJSONResponse renders a pydantic model with its compiled `model_dump_json()`,
+skipping FastAPI's response_model validation and `jsonable_encoder` traversal. Use it
+with `response_model=None` on routes that return a model directly.
+"""
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class PydanticJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode()
+
+
+def sse_event(data: str) -> str:
+    # multi-line payloads need one "data:" field per line
+    return "".join(f"data: {line}\n" for line in data.split("\n")) + "\n"
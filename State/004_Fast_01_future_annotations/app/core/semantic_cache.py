@@ -0,0 +1,81 @@
+"""
+Semantic response cache for near-duplicate prompts.
+
+Exact-match keys miss rephrasings such as "What is ENT claim?" vs "Explain ENT claim".
+When `SEMANTIC_CACHE=true`, `(question, context)` is embedded with a small local
+sentence-transformers model and looked up in an in-process HNSW index (hnswlib, cosine
+space); a neighbour at or above `SEMANTIC_CACHE_THRESHOLD` similarity is answered from
+the cache. The index holds at most `LLM_CACHE_MAXSIZE` entries, replacing the oldest
+when full. Needs the optional `sentence-transformers` and `hnswlib` packages, both
+imported on first use.
+"""
+import asyncio
+import threading
+from collections import deque
+from app.core.config import settings
+
+
+class SemanticCache():
+    def __init__(self, threshold: float = 0.95, max_elements: int = 1024,
+                 model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+        self.threshold = threshold
+        self.max_elements = max_elements
+        self.model_name = model_name
+        self._encoder = None
+        self._index = None
+        self._responses = {}
+        self._labels = deque()
+        self._next_label = 0
+        # embed() runs _load in worker threads; only the first caller builds the model
+        self._load_lock = threading.Lock()
+
+    def _load(self):
+        if self._index is not None:
+            return
+        with self._load_lock:
+            if self._index is None:
+                import hnswlib
+                from sentence_transformers import SentenceTransformer
+                self._encoder = SentenceTransformer(self.model_name)
+                index = hnswlib.Index(space="cosine",
+                                      dim=self._encoder.get_sentence_embedding_dimension())
+                index.init_index(max_elements=self.max_elements, ef_construction=200, M=16,
+                                 allow_replace_deleted=True)
+                # published last: a set _index means _encoder is ready too
+                self._index = index
+
+    def _encode(self, text: str):
+        self._load()
+        return self._encoder.encode(text, normalize_embeddings=True)
+
+    async def embed(self, text: str):
+        # model inference is CPU bound, keep it off the event loop
+        return await asyncio.to_thread(self._encode, text)
+
+    def get(self, vector):
+        if not self._responses:
+            return None
+        labels, distances = self._index.knn_query(vector, k=1)
+        if 1 - distances[0][0] < self.threshold:
+            return None
+        return self._responses.get(int(labels[0][0]))
+
+    def set(self, vector, value):
+        if len(self._labels) >= self.max_elements:
+            oldest = self._labels.popleft()
+            self._index.mark_deleted(oldest)
+            del self._responses[oldest]
+        label = self._next_label
+        self._next_label += 1
+        self._index.add_items(vector, [label], replace_deleted=True)
+        self._responses[label] = value
+        self._labels.append(label)
+
+
+def is_semantic_cache_enabled() -> bool:
+    return settings.semantic_cache
+
+
+semantic_cache = SemanticCache(threshold=settings.semantic_cache_threshold,
+                               max_elements=settings.llm_cache_maxsize,
+                               model_name=settings.semantic_cache_model)
@@ -0,0 +1,26 @@
+"""
+Single-flight coalescing of identical in-flight calls.
+
+`await single_flight.do(key, fn)` runs `fn()` once per key at a time: callers arriving
+while a call for the same key is still running await that call's result instead of
+starting their own. The key is dropped as soon as the call finishes, so completed
+results are memoized only by the response caches, not here.
+"""
+import asyncio
+
+
+class SingleFlight():
+    def __init__(self):
+        self._inflight = {}
+
+    async def do(self, key, fn):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: one caller disconnecting must not cancel the call for the others
+        return await asyncio.shield(task)
+
+    def __len__(self):
+        return len(self._inflight)
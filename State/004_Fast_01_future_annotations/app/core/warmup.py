@@ -0,0 +1,74 @@
+"""
+Startup warm-up.
+
+Run from the FastAPI lifespan before the first request is accepted, so that request does
+not pay for building the cached ChatOpenAI clients and prompt templates, reading prompt
+files or opening the first pooled DB connection. The DB connection is only opened when a
+DB-backed router was enabled (`db_loaded()`), so route sets without one never build the engine.
+
+Only routers that are enabled (and therefore imported, see app/api/router.py) are warmed:
+their argument-free `lru_cache` factories (`get_llm`, `get_prompt`, ...) are called once,
+and modules listing `PROMPT_FILES` load each file through `get_prompt(file_name)`.
+`WARMUP_LLM_PING=true` additionally sends one tiny prompt through the first `get_llm()`
+found, which also opens the provider connection (costs one call per worker).
+"""
+import asyncio
+import inspect
+import logging
+import sys
+from app.api.router import db_loaded
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+WARMUP_FACTORIES = ("get_llm", "get_prompt", "get_prompt_template", "get_chat_prompt_template")
+DB_CONNECT_TIMEOUT_S = 5
+
+
+def _is_cached_factory(fn) -> bool:
+    if not callable(fn) or not hasattr(fn, "cache_info"):
+        return False
+    return all(p.default is not p.empty for p in inspect.signature(fn).parameters.values())
+
+
+def warm_llm_modules() -> list:
+    llms = []
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("app.api."):
+            continue
+        for factory in WARMUP_FACTORIES:
+            fn = getattr(module, factory, None)
+            if _is_cached_factory(fn):
+                obj = fn()
+                if factory == "get_llm":
+                    llms.append(obj)
+        for file_name in getattr(module, "PROMPT_FILES", ()):
+            module.get_prompt(file_name)
+    return llms
+
+
+async def _connect_db():
+    from app.dal.connections.sql_connection import engine
+    async with engine.connect():
+        pass
+
+
+async def warm_db():
+    try:
+        await asyncio.wait_for(_connect_db(), DB_CONNECT_TIMEOUT_S)
+    except Exception as ex:
+        # the app still starts; the first DB request retries through the pool
+        logger.warning("DB warm-up failed: %s", ex)
+
+
+async def warm_up():
+    if not settings.warmup_enabled:
+        return
+    llms = warm_llm_modules()
+    if db_loaded():
+        await warm_db()
+    if settings.warmup_llm_ping and llms:
+        try:
+            await llms[0].ainvoke("ping")
+        except Exception as ex:
+            logger.warning("LLM warm-up ping failed: %s", ex)
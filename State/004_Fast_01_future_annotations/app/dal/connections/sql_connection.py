@@ -1,33 +1,41 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker,Session
+import logging
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
 
 SQL_CONNECTION = (
-    "mssql+pyodbc://@"
+    "mssql+aioodbc://@"
     "(localdb)\\MSSQLLocalDB/MCP_ACRS"
     "?driver=ODBC+Driver+17+for+SQL+Server"
     "&Trusted_Connection=yes"
     "&TrustServerCertificate=yes"
 )
 
-engine = create_engine(SQL_CONNECTION,
-                       pool_pre_ping=True,
-                        future=True)
+# query_cache_size: compiled SQL statement cache (SQLAlchemy default 500); sized up so
+# repeated statement shapes are never recompiled.
+engine = create_async_engine(SQL_CONNECTION,
+                             pool_pre_ping=True,
+                             pool_size=20,
+                             max_overflow=40,
+                             query_cache_size=settings.db_query_cache_size,
+                             echo=False)
 
-SessionLocal = sessionmaker(
+SessionLocal = async_sessionmaker(
                             bind=engine,
                             autoflush=False,
-                            autocommit=False,
-                            future=True
+                            expire_on_commit=False
                             )
 
 
-def get_db() -> Session:
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncSession:
+    async with SessionLocal() as db:
         yield db
-    # except Exception as ex:
-    #     raise ex
-    finally:
-        db.close()
\ No newline at end of file
+
+
+def log_engine_stats():
+    compiled_cache = engine.sync_engine._compiled_cache
+    logger.info("SQL pool: %s | compiled statement cache: %s/%s entries",
+                engine.pool.status(),
+                len(compiled_cache) if compiled_cache is not None else 0,
+                settings.db_query_cache_size)
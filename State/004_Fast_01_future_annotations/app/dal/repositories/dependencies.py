@@ -1,8 +1,8 @@
 # app/api/dependencies.py
-from fastapi import Depends
-from sqlalchemy.orm import Session
-from app.dal.connections.sql_connection import get_db
 from app.dal.repositories.user_repository import UserRepository
+from app.dal.dependencies_dal import get_map_user
 
-def get_user_repo(db: Session = Depends(get_db)):
-    return UserRepository(db)
+user_repository = UserRepository(get_map_user())
+
+def get_user_repo() -> UserRepository:
+    return user_repository
@@ -2,6 +2,6 @@
 from app.dal.repositories.sql_base_repository import SQLBaseRepository
 
 
-class PromptRepository():
+class PromptRepository(SQLBaseRepository):
     def __init__(self):
         pass
\ No newline at end of file
@@ -1,13 +1,22 @@
 #WILL IMPLEMENT BASE REPOSITORY CODE
-from sqlalchemy import null
-from sqlalchemy.orm import Session
-from dal.connections import sql_connection
+from typing import Protocol, TypeVar
+
+
+class InvalidFlagged(Protocol):
+    # pydantic ItemBase models and the UserModel dataclass both carry these two fields
+    Message: dict | str | None
+    IsInvalid: bool
+
+
+M = TypeVar("M", bound=InvalidFlagged)
+
 
 class SQLBaseRepository:
-    def __init__(self):
-        self.db = self.get_sql_session()
+    # Stateless: the request's AsyncSession comes from the get_db dependency
+    # (app/dal/connections/sql_connection.py) and is passed to each call, so a repository
+    # never opens a session of its own and get_db closes it when the request ends.
 
-    def get_sql_session(self):
-        if self.db == null:
-            self.db =  sql_connection.get_db()
-        return self.db
\ No newline at end of file
+    def set_inv_msg(self, model: M, msg: str) -> M:
+        model.IsInvalid = True
+        model.Message = msg
+        return model
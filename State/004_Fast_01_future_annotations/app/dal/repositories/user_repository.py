@@ -2,34 +2,30 @@ from typing_extensions import Annotated
 from app.dal.entities import User
 from app.models.user_model import UserModel
 from fastapi import Depends
-from sqlalchemy.orm import session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.dal.connections.sql_connection import get_db
 
 from app.dal.utilities.module.map_user import MapUser
 from app.dal.dependencies_dal import get_map_user
 from app.dal.entities.User import UserEntity
+from app.dal.repositories.sql_base_repository import SQLBaseRepository
 
 
-class UserRepository():
-    def __init__(self,db: session,map_user: MapUser):
-        self.db = db
+class UserRepository(SQLBaseRepository):
+    # Stateless: one instance per process, the request's session is passed per call
+    def __init__(self,map_user: MapUser):
         self.map_user = map_user
 
-    def set_inv_msg(self, model: UserModel, msg: str) -> UserModel:
-        model.IsInvalid = True
-        model.Message = msg
-        return model
-
-    def create_user(self,model: UserModel)->UserModel:
+    async def create_user(self,db: AsyncSession,model: UserModel)->UserModel:
         try:
-            if self.db == None:
+            if db is None:
                 model = self.set_inv_msg(model=model,msg="Database session is None")
                 return model
             # entity = self.map_user.UserItemToEntity(model.item)
             entity = UserEntity(UserId=model.item.UserId, Name=model.item.Name)
-            self.db.add(entity)
-            self.db.commit()
-            self.db.refresh(entity)
+            db.add(entity)
+            await db.commit()
+            await db.refresh(entity)
             model.item = self.map_user.UserEntityToItem(entity)
             return model
         except Exception as ex:
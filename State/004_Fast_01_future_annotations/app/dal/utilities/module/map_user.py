@@ -9,15 +9,8 @@ class MapUser():
         pass
 
     def UserItemToEntity(self, source: UserItem) -> UserEntity:
-        destination = UserEntity()
-        destination.Id = source.Id
-        destination.UserId = source.UserId
-        destination.Name = source.Name
-        return destination
+        return UserEntity(Id=source.Id, UserId=source.UserId, Name=source.Name)
         
     def UserEntityToItem(self, source: UserEntity) -> UserItem:
-        destination = UserItem()
-        destination.Id = source.Id
-        destination.Name = source.Name
-        destination.UserId = source.UserId
-        return destination
\ No newline at end of file
+        # trusted DB values, no validation needed
+        return UserItem.model_construct(Id=source.Id, UserId=source.UserId, Name=source.Name)
\ No newline at end of file
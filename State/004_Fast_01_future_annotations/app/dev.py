@@ -0,0 +1,9 @@
+'''
+Development server: single process with auto-reload.
+Run from the project root: python -m app.dev
+'''
+import uvicorn
+from app.core.config import settings
+
+if __name__ == "__main__":
+    uvicorn.run("app.main:app", host=settings.host, port=settings.port, reload=True)
@@ -4,24 +4,75 @@ VISHNU KIRAN M
 Description: sample fast api which will help you to start work on AI process
 '''
 
-from fastapi import FastAPI
-from app.api.router import api_router
+from contextlib import asynccontextmanager
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from app.api.router import api_router, db_loaded
+from app.core.responses import ORJSONResponse
+from app.core.llm_cache import configure_llm_cache
+from app.core.openai_client import close_openai_client
+from app.core.log_config import configure_logging, stop_logging
+from app.core.errors import register_exception_handlers
+from app.core.warmup import warm_up
+from app.core.config import settings
+
+
+def _log_engine_stats():
+    # the engine exists only when a DB-backed router was enabled; never build it here
+    if db_loaded():
+        from app.dal.connections.sql_connection import log_engine_stats
+        log_engine_stats()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_up()
+    _log_engine_stats()
+    yield
+    await close_openai_client()
+    _log_engine_stats()
+    stop_logging()
+
 
 # Create FastAPI instance
 app = FastAPI(title="VISHNU KIRAN M Industrial AI Assistant", version="1.0.0",
-              description="Description."
+              description="Description.",
+              default_response_class=ORJSONResponse,
+              lifespan=lifespan
               )
 
+configure_logging()
+configure_llm_cache()
+register_exception_handlers(app)
+if settings.gzip_min_size > 0:
+    # only for clients sending Accept-Encoding: gzip; event streams are left uncompressed
+    app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_min_size,
+                       compresslevel=settings.gzip_level)
+
+# constant payload, encoded once; the route skips serialization entirely
+_API_INIT = orjson.dumps({"message": "API initialized"})
+
 @app.get("/")
-def api_init():
-    return {"message": "API initialized"}
+async def api_init():
+    return Response(content=_API_INIT, media_type="application/json")
 
 app.include_router(api_router, prefix="/api")
 
-# # Optional: allow `python -m app.main`
+# # Optional: allow `python -m app.main` (production: multiple workers, no reload)
+# # For development with auto-reload use `python -m app.dev`
 if __name__ == "__main__":
+    import os
+    import sys
     import uvicorn
-    uvicorn.run("main:app", host="127.0.0.25", port=825, reload=True)
+    uvicorn.run("app.main:app", host=settings.host, port=settings.port,
+                workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+                # uvloop is not available on Windows; uvicorn[standard] installs it elsewhere
+                loop="asyncio" if sys.platform == "win32" else "uvloop",
+                http="httptools",
+                log_level=settings.log_level.lower(),
+                access_log=settings.access_log,
+                reload=False)
 # cd C:\v\v\learn\lv_python\ai\VishAgent
 # python -m uvicorn app.main:app --host 127.0.0.25 --port 825
 
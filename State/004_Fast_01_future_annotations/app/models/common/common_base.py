@@ -17,12 +17,13 @@ class ItemBase(BaseModel):
     Abstract base model for all request/response models.
     
     Attributes:
-        Message (str | None): Optional message field for responses/errors
+        Message (dict | str | None): Optional message field for responses/errors
+            (error branches assign {"error": ...} dicts)
         IsInvalid (bool): Flag indicating if the item failed validation
     """
     __abstract__ = True
     
-    Message: str | None = None
+    Message: dict | str | None = None
     IsInvalid: bool = False
     
     model_config = ConfigDict(
@@ -37,7 +38,9 @@ class ItemBase(BaseModel):
         # Allow arbitrary types (useful for custom types)
         arbitrary_types_allowed=False,
         # Strip whitespace from strings
-        str_strip_whitespace=False
+        str_strip_whitespace=False,
+        # Ignore unknown fields instead of storing them
+        extra="ignore"
     )
 
 
@@ -1,8 +1,10 @@
 
 
+from dataclasses import dataclass
 from typing import Optional
+from pydantic import Field
 from app.models.common.common_base import (
-                                        ItemBase, ModelBase,RequestBase,ResponseBase
+                                        ItemBase, RequestBase,ResponseBase
                                       )
 class UserItem(ItemBase):
     Id:int=0
@@ -14,6 +16,10 @@ class UserRequest(RequestBase):
     UserId:int=0
     Name:str=""
 
+# create/user only: a new user needs a positive UserId (422 otherwise)
+class CreateUserRequest(UserRequest):
+    UserId:int=Field(gt=0)
+
 class UserResponse(ResponseBase):
     Id:int=0
     UserId:int=0
@@ -23,10 +29,16 @@ class UserResponse(ResponseBase):
 class UserResponses(ResponseBase):
     items: Optional[list[UserItem]] = None
 
-class UserModel(ModelBase):
+# Internal carrier between api, service and repository; it is never parsed from or
+# serialized to JSON, so a slotted dataclass replaces the pydantic model (no per-instance
+# __dict__, no validation machinery). Same fields as ModelBase.
+@dataclass(slots=True)
+class UserModel():
     item:Optional[UserItem]=None
     response:Optional[UserResponse]=None
     request:Optional[UserRequest]=None
+    Message:dict | str | None=None
+    IsInvalid:bool=False
  
     
  
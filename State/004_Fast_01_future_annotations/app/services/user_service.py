@@ -6,21 +6,23 @@ from app.models.user_model import (
 from fastapi import Depends
 from app.dal.repositories.user_repository import UserRepository
 from app.common.modules.users.user_validation_utility import UserValidationUtility
+from sqlalchemy.ext.asyncio import AsyncSession
     
 
 class UserService():
+    # Stateless: one instance per process, the request's session is passed per call
     def __init__(self, user_repository: UserRepository, user_validation_utility:UserValidationUtility):
         self.user_repository = user_repository
         self.user_validation_utility = user_validation_utility
 
     def set_response(self, model: UserModel) -> UserModel:
         if model.IsInvalid:
-            response = UserResponse()
+            response = UserResponse.model_construct()
             response.IsInvalid = True
             response.Message = model.Message
             model.response = response
         else:
-            response = UserResponse(
+            response = UserResponse.model_construct(
                 UserId=model.item.UserId if model.item else 0,
                 Name=model.item.Name if model.item else "",
                 Message="User created successfully"
@@ -28,13 +30,13 @@ class UserService():
             model.response = response
         return model
         
-    def create_user(self, model: UserModel) -> UserModel:
+    async def create_user(self, db: AsyncSession, model: UserModel) -> UserModel:
         model = self.user_validation_utility.validate_user_model(model)
         
         if model.IsInvalid:
             model = self.set_response(model)
             return model
         
-        model =  self.user_repository.create_user(model)
+        model = await self.user_repository.create_user(db, model)
         model = self.set_response(model)
         return model
\ No newline at end of file